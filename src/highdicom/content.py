@@ -1,8 +1,17 @@
 """Generic Data Elements that can be included in a variety of IODs."""
-from collections import Counter
 import datetime
 from copy import deepcopy
-from typing import cast, Dict, List, Optional, Union, Sequence, Tuple
+from typing import (
+    cast,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 import numpy as np
 from pydicom.dataset import Dataset
@@ -20,9 +29,10 @@ from highdicom.enum import (
     VOILUTFunctionValues,
 )
 from highdicom.sr.enum import ValueTypeValues
-from highdicom.sr.coding import CodedConcept
+from highdicom.sr.coding import CodedConcept, _get_code_key
 from highdicom.sr.value_types import (
     CodeContentItem,
+    ContentItem,
     ContentSequence,
     DateTimeContentItem,
     NumContentItem,
@@ -39,6 +49,25 @@ from highdicom._module_utils import (
     does_iod_have_pixel_data
 )
 
+# Concept names of content items of template TID 8001 "Specimen Preparation"
+_SPECIMEN_IDENTIFIER = codes.DCM.SpecimenIdentifier
+_ISSUER_OF_SPECIMEN_IDENTIFIER = codes.DCM.IssuerOfSpecimenIdentifier
+_PROCESSING_TYPE = codes.DCM.ProcessingType
+_DATETIME_OF_PROCESSING = codes.DCM.DatetimeOfProcessing
+_PROCESSING_STEP_DESCRIPTION = codes.DCM.ProcessingStepDescription
+_SPECIMEN_COLLECTION = codes.SCT.SpecimenCollection
+_USING_SUBSTANCE = codes.SCT.UsingSubstance
+_SAMPLING_METHOD = codes.DCM.SamplingMethod
+_PARENT_SPECIMEN_IDENTIFIER = codes.DCM.ParentSpecimenIdentifier
+_ISSUER_OF_PARENT_SPECIMEN_IDENTIFIER = (
+    codes.DCM.IssuerOfParentSpecimenIdentifier
+)
+_PARENT_SPECIMEN_TYPE = codes.DCM.ParentSpecimenType
+_TISSUE_FIXATIVE = codes.SCT.TissueFixative
+_TISSUE_EMBEDDING_MEDIUM = codes.SCT.TissueEmbeddingMedium
+_SPECIMEN_CONTAINER = codes.SCT.SpecimenContainer
+_SPECIMEN_TYPE = codes.SCT.SpecimenType
+
 
 class AlgorithmIdentificationSequence(DataElementSequence):
 
@@ -845,7 +874,7 @@ class SpecimenCollection(ContentSequence):
         """  # noqa: E501
         super().__init__(is_root=False, is_sr=False)
         item = CodeContentItem(
-            name=codes.SCT.SpecimenCollection,
+            name=_SPECIMEN_COLLECTION,
             value=procedure
         )
         self.append(item)
@@ -853,7 +882,7 @@ class SpecimenCollection(ContentSequence):
     @property
     def procedure(self) -> CodedConcept:
         """highdicom.sr.CodedConcept: Surgical procedure"""
-        items = self.find(codes.SCT.SpecimenCollection)
+        items = self.find(_SPECIMEN_COLLECTION)
         if len(items) == 0:
             raise AttributeError(
                 'Could not find content item "Specimen Collection".'
@@ -893,12 +922,12 @@ class SpecimenSampling(ContentSequence):
         super().__init__(is_root=False, is_sr=False)
         # CID 8110
         method_item = CodeContentItem(
-            name=codes.DCM.SamplingMethod,
+            name=_SAMPLING_METHOD,
             value=method
         )
         self.append(method_item)
         parent_specimen_identitier_item = TextContentItem(
-            name=codes.DCM.ParentSpecimenIdentifier,
+            name=_PARENT_SPECIMEN_IDENTIFIER,
             value=parent_specimen_id
         )
         self.append(parent_specimen_identitier_item)
@@ -908,13 +937,13 @@ class SpecimenSampling(ContentSequence):
             except AttributeError:
                 entity_id = issuer_of_parent_specimen_id.LocalNamespaceEntityID
             issuer_of_parent_specimen_identitier_item = TextContentItem(
-                name=codes.DCM.IssuerOfParentSpecimenIdentifier,
+                name=_ISSUER_OF_PARENT_SPECIMEN_IDENTIFIER,
                 value=entity_id
             )
             self.append(issuer_of_parent_specimen_identitier_item)
         # CID 8103
         parent_specimen_type_item = CodeContentItem(
-            name=codes.DCM.ParentSpecimenType,
+            name=_PARENT_SPECIMEN_TYPE,
             value=parent_specimen_type
         )
         self.append(parent_specimen_type_item)
@@ -922,7 +951,7 @@ class SpecimenSampling(ContentSequence):
     @property
     def method(self) -> CodedConcept:
         """highdicom.sr.CodedConcept: Sampling method"""
-        items = self.find(codes.DCM.SamplingMethod)
+        items = self.find(_SAMPLING_METHOD)
         if len(items) == 0:
             raise AttributeError(
                 'Could not find content item "Sampling Method".'
@@ -932,7 +961,7 @@ class SpecimenSampling(ContentSequence):
     @property
     def parent_specimen_id(self) -> str:
         """str: Parent specimen identifier"""
-        items = self.find(codes.DCM.ParentSpecimenIdentifier)
+        items = self.find(_PARENT_SPECIMEN_IDENTIFIER)
         if len(items) == 0:
             raise AttributeError(
                 'Could not find content item "Parent Specimen Identifier".'
@@ -942,7 +971,7 @@ class SpecimenSampling(ContentSequence):
     @property
     def parent_specimen_type(self) -> CodedConcept:
         """highdicom.sr.CodedConcept: Parent specimen type"""
-        items = self.find(codes.DCM.ParentSpecimenType)
+        items = self.find(_PARENT_SPECIMEN_TYPE)
         if len(items) == 0:
             raise AttributeError(
                 'Could not find content item "Parent Specimen Type".'
@@ -979,12 +1008,12 @@ class SpecimenStaining(ContentSequence):
         for s in substances:
             if isinstance(s, (Code, CodedConcept)):
                 item = CodeContentItem(
-                    name=codes.SCT.UsingSubstance,
+                    name=_USING_SUBSTANCE,
                     value=s
                 )
             elif isinstance(s, str):
                 item = TextContentItem(
-                    name=codes.SCT.UsingSubstance,
+                    name=_USING_SUBSTANCE,
                     value=s
                 )
             else:
@@ -997,7 +1026,7 @@ class SpecimenStaining(ContentSequence):
     @property
     def substances(self) -> List[CodedConcept]:
         """List[highdicom.sr.CodedConcept]: Substances used for staining"""
-        items = self.find(codes.SCT.UsingSubstance)
+        items = self.find(_USING_SUBSTANCE)
         return [item.value for item in items]
 
 
@@ -1022,12 +1051,12 @@ class SpecimenProcessing(ContentSequence):
         # CID 8112
         if isinstance(description, str):
             item = TextContentItem(
-                name=codes.DCM.ProcessingStepDescription,
+                name=_PROCESSING_STEP_DESCRIPTION,
                 value=description
             )
         else:
             item = CodeContentItem(
-                name=codes.DCM.ProcessingStepDescription,
+                name=_PROCESSING_STEP_DESCRIPTION,
                 value=description
             )
         self.append(item)
@@ -1035,7 +1064,7 @@ class SpecimenProcessing(ContentSequence):
     @property
     def description(self) -> CodedConcept:
         """highdicom.sr.CodedConcept: Processing step description"""
-        items = self.find(codes.DCM.ProcessingStepDescription)
+        items = self.find(_PROCESSING_STEP_DESCRIPTION)
         if len(items) == 0:
             raise AttributeError(
                 'Could not find content item "Processing Step Description".'
@@ -1043,6 +1072,110 @@ class SpecimenProcessing(ContentSequence):
         return items[0].value
 
 
+def _get_specimen_collection(
+    sequence: ContentSequence
+) -> SpecimenCollection:
+    collection_items = sequence.find(_SPECIMEN_COLLECTION)
+    if len(collection_items) != 1:
+        raise ValueError(
+            'Specimen Preparation Step Content Item Sequence must '
+            'contain exactly one content item "Specimen Collection" '
+            'when processing type is "Specimen Collection".'
+        )
+    return SpecimenCollection(procedure=collection_items[0].value)
+
+
+def _get_specimen_processing(
+    sequence: ContentSequence
+) -> SpecimenProcessing:
+    description_items = sequence.find(_PROCESSING_STEP_DESCRIPTION)
+    if len(description_items) != 1:
+        raise ValueError(
+            'Specimen Preparation Step Content Item Sequence must '
+            'contain exactly one content item "Processing Step '
+            'Description" when processing type is "Specimen '
+            'Processing".'
+        )
+    return SpecimenProcessing(description=description_items[0].value)
+
+
+def _get_specimen_staining(sequence: ContentSequence) -> SpecimenStaining:
+    substance_items = sequence.find(_USING_SUBSTANCE)
+    if len(substance_items) == 0:
+        raise ValueError(
+            'Specimen Preparation Step Content Item Sequence must '
+            'contain one or more content item "Using Substance" '
+            'when processing type is "Staining".'
+        )
+    return SpecimenStaining(
+        substances=[item.value for item in substance_items]
+    )
+
+
+def _get_specimen_sampling(sequence: ContentSequence) -> SpecimenSampling:
+    sampling_method_items = sequence.find(_SAMPLING_METHOD)
+    if len(sampling_method_items) != 1:
+        raise ValueError(
+            'Specimen Preparation Step Content Item Sequence must '
+            'contain exactly one content item "Sampling Method" '
+            'when processing type is "Sampling of Tissue Specimen".'
+        )
+    parent_specimen_id_items = sequence.find(
+        _PARENT_SPECIMEN_IDENTIFIER
+    )
+    if len(parent_specimen_id_items) != 1:
+        raise ValueError(
+            'Specimen Preparation Step Content Item Sequence must '
+            'contain exactly one content item "Parent Specimen '
+            'Identifier" when processing type is "Sampling of Tissue '
+            'Specimen".'
+        )
+    parent_specimen_type_items = sequence.find(
+        _PARENT_SPECIMEN_TYPE
+    )
+    if len(parent_specimen_type_items) != 1:
+        raise ValueError(
+            'Specimen Preparation Step Content Item Sequence must '
+            'contain exactly one content item "Parent Specimen '
+            'Type" when processing type is "Sampling of Tissue '
+            'Specimen".'
+        )
+    issuer_of_parent_specimen_type_items = sequence.find(
+        _ISSUER_OF_PARENT_SPECIMEN_IDENTIFIER
+    )
+    if len(issuer_of_parent_specimen_type_items) > 0:
+        issuer = issuer_of_parent_specimen_type_items[0].value
+    else:
+        issuer = None
+    return SpecimenSampling(
+        method=sampling_method_items[0].value,
+        parent_specimen_id=parent_specimen_id_items[0].value,
+        parent_specimen_type=parent_specimen_type_items[0].value,
+        issuer_of_parent_specimen_id=issuer
+    )
+
+
+# Functions that construct the processing procedure of a specimen preparation
+# step from its content items, keyed on the "Processing Type" (CID 8111)
+_PROCESSING_PROCEDURE_GETTERS: Dict[
+    Tuple[str, str, Optional[str]],
+    Callable[
+        [ContentSequence],
+        Union[
+            SpecimenCollection,
+            SpecimenSampling,
+            SpecimenStaining,
+            SpecimenProcessing,
+        ]
+    ]
+] = {
+    _get_code_key(_SPECIMEN_COLLECTION): _get_specimen_collection,
+    _get_code_key(codes.SCT.SpecimenProcessing): _get_specimen_processing,
+    _get_code_key(codes.SCT.Staining): _get_specimen_staining,
+    _get_code_key(codes.SCT.SamplingOfTissueSpecimen): _get_specimen_sampling,
+}
+
+
 class SpecimenPreparationStep(Dataset):
 
     """Dataset describing a specimen preparation step according to structured
@@ -1106,25 +1239,27 @@ class SpecimenPreparationStep(Dataset):
                 'Processing description must be None if procedure is of type '
                 '"SpecimenProcessing".'
             )
-        sequence = ContentSequence(is_root=False, is_sr=False)
+        # Collect the items first, such that the ContentSequence is only
+        # constructed and validated once
+        items: List[ContentItem] = []
         specimen_identifier_item = TextContentItem(
-            name=codes.DCM.SpecimenIdentifier,
+            name=_SPECIMEN_IDENTIFIER,
             value=specimen_id
         )
-        sequence.append(specimen_identifier_item)
+        items.append(specimen_identifier_item)
         if issuer_of_specimen_id is not None:
             try:
                 entity_id = issuer_of_specimen_id.UniversalEntityID
             except AttributeError:
                 entity_id = issuer_of_specimen_id.LocalNamespaceEntityID
             issuer_of_specimen_id_item = TextContentItem(
-                name=codes.DCM.IssuerOfSpecimenIdentifier,
+                name=_ISSUER_OF_SPECIMEN_IDENTIFIER,
                 value=entity_id
             )
-            sequence.append(issuer_of_specimen_id_item)
+            items.append(issuer_of_specimen_id_item)
 
         if isinstance(processing_procedure, SpecimenCollection):
-            processing_type = codes.SCT.SpecimenCollection
+            processing_type = _SPECIMEN_COLLECTION
         elif isinstance(processing_procedure, SpecimenProcessing):
             processing_type = codes.SCT.SpecimenProcessing
         elif isinstance(processing_procedure, SpecimenStaining):
@@ -1140,17 +1275,17 @@ class SpecimenPreparationStep(Dataset):
 
         # CID 8111
         processing_type_item = CodeContentItem(
-            name=codes.DCM.ProcessingType,
+            name=_PROCESSING_TYPE,
             value=processing_type
         )
-        sequence.append(processing_type_item)
+        items.append(processing_type_item)
 
         if processing_datetime is not None:
             processing_datetime_item = DateTimeContentItem(
-                name=codes.DCM.DatetimeOfProcessing,
+                name=_DATETIME_OF_PROCESSING,
                 value=processing_datetime
             )
-            sequence.append(processing_datetime_item)
+            items.append(processing_datetime_item)
         if processing_description is not None:
             processing_description_item: Union[
                 TextContentItem,
@@ -1158,49 +1293,53 @@ class SpecimenPreparationStep(Dataset):
             ]
             if isinstance(processing_description, str):
                 processing_description_item = TextContentItem(
-                    name=codes.DCM.ProcessingStepDescription,
+                    name=_PROCESSING_STEP_DESCRIPTION,
                     value=processing_description
                 )
             else:
                 processing_description_item = CodeContentItem(
-                    name=codes.DCM.ProcessingStepDescription,
+                    name=_PROCESSING_STEP_DESCRIPTION,
                     value=processing_description
                 )
-            sequence.append(processing_description_item)
+            items.append(processing_description_item)
 
         self._processing_procedure = processing_procedure
-        sequence.extend(processing_procedure)
+        items.extend(processing_procedure)
         if fixative is not None:
             tissue_fixative_item = CodeContentItem(
-                name=codes.SCT.TissueFixative,
+                name=_TISSUE_FIXATIVE,
                 value=fixative
             )
-            sequence.append(tissue_fixative_item)
+            items.append(tissue_fixative_item)
         if embedding_medium is not None:
             embedding_medium_item = CodeContentItem(
-                name=codes.SCT.TissueEmbeddingMedium,
+                name=_TISSUE_EMBEDDING_MEDIUM,
                 value=embedding_medium
             )
-            sequence.append(embedding_medium_item)
+            items.append(embedding_medium_item)
         if specimen_container is not None:
             specimen_container_item = CodeContentItem(
-                name=codes.SCT.SpecimenContainer,
+                name=_SPECIMEN_CONTAINER,
                 value=specimen_container
             )
-            sequence.append(specimen_container_item)
+            items.append(specimen_container_item)
         if specimen_type is not None:
             specimen_type_item = CodeContentItem(
-                name=codes.SCT.SpecimenType,
+                name=_SPECIMEN_TYPE,
                 value=specimen_type
             )
-            sequence.append(specimen_type_item)
-        self.SpecimenPreparationStepContentItemSequence = sequence
+            items.append(specimen_type_item)
+        self.SpecimenPreparationStepContentItemSequence = ContentSequence(
+            items,
+            is_root=False,
+            is_sr=False
+        )
 
     @property
     def specimen_id(self) -> str:
         """str: Specimen identifier"""
         items = self.SpecimenPreparationStepContentItemSequence.find(
-            codes.DCM.SpecimenIdentifier
+            _SPECIMEN_IDENTIFIER
         )
         if len(items) == 0:
             raise AttributeError(
@@ -1212,7 +1351,7 @@ class SpecimenPreparationStep(Dataset):
     def processing_type(self) -> CodedConcept:
         """highdicom.sr.CodedConcept: Processing type"""
         items = self.SpecimenPreparationStepContentItemSequence.find(
-            codes.DCM.ProcessingType
+            _PROCESSING_TYPE
         )
         if len(items) == 0:
             raise AttributeError(
@@ -1239,7 +1378,7 @@ class SpecimenPreparationStep(Dataset):
     def fixative(self) -> Union[CodedConcept, None]:
         """highdicom.sr.CodedConcept: Tissue fixative"""
         items = self.SpecimenPreparationStepContentItemSequence.find(
-            codes.SCT.TissueFixative
+            _TISSUE_FIXATIVE
         )
         if len(items) == 0:
             return None
@@ -1249,7 +1388,7 @@ class SpecimenPreparationStep(Dataset):
     def embedding_medium(self) -> Union[CodedConcept, None]:
         """highdicom.sr.CodedConcept: Tissue embedding medium"""
         items = self.SpecimenPreparationStepContentItemSequence.find(
-            codes.SCT.TissueEmbeddingMedium
+            _TISSUE_EMBEDDING_MEDIUM
         )
         if len(items) == 0:
             return None
@@ -1261,7 +1400,7 @@ class SpecimenPreparationStep(Dataset):
         if isinstance(self._processing_procedure, SpecimenProcessing):
             return None
         items = self.SpecimenPreparationStepContentItemSequence.find(
-            codes.DCM.ProcessingStepDescription
+            _PROCESSING_STEP_DESCRIPTION
         )
         if len(items) == 0:
             return None
@@ -1272,7 +1411,7 @@ class SpecimenPreparationStep(Dataset):
         """datetime.datetime: Processing datetime"""
 
         items = self.SpecimenPreparationStepContentItemSequence.find(
-            codes.DCM.DatetimeOfProcessing
+            _DATETIME_OF_PROCESSING
         )
         if len(items) == 0:
             return None
@@ -1283,7 +1422,7 @@ class SpecimenPreparationStep(Dataset):
         """str: Issuer of specimen id"""
 
         items = self.SpecimenPreparationStepContentItemSequence.find(
-            codes.DCM.IssuerOfSpecimenIdentifier
+            _ISSUER_OF_SPECIMEN_IDENTIFIER
         )
         if len(items) == 0:
             return None
@@ -1294,7 +1433,7 @@ class SpecimenPreparationStep(Dataset):
         """highdicom.sr.CodedConcept: Specimen container"""
 
         items = self.SpecimenPreparationStepContentItemSequence.find(
-            codes.SCT.SpecimenContainer
+            _SPECIMEN_CONTAINER
         )
         if len(items) == 0:
             return None
@@ -1305,7 +1444,7 @@ class SpecimenPreparationStep(Dataset):
         """highdicom.sr.CodedConcept: Specimen type"""
 
         items = self.SpecimenPreparationStepContentItemSequence.find(
-            codes.SCT.SpecimenType
+            _SPECIMEN_TYPE
         )
         if len(items) == 0:
             return None
@@ -1338,13 +1477,13 @@ class SpecimenPreparationStep(Dataset):
         instance.SpecimenPreparationStepContentItemSequence = sequence
         instance.__class__ = cls
         # Order of template TID 8001 "Specimen Preparation" is significant
-        specimen_identifier_items = sequence.find(codes.DCM.SpecimenIdentifier)
+        specimen_identifier_items = sequence.find(_SPECIMEN_IDENTIFIER)
         if len(specimen_identifier_items) != 1:
             raise ValueError(
                 'Specimen Preparation Step Content Item Sequence must contain '
                 'exactly one content item "Specimen Identifier".'
             )
-        processing_type_items = sequence.find(codes.DCM.ProcessingType)
+        processing_type_items = sequence.find(_PROCESSING_TYPE)
         if len(processing_type_items) != 1:
             raise ValueError(
                 'Specimen Preparation Step Content Item Sequence must contain '
@@ -1352,96 +1491,18 @@ class SpecimenPreparationStep(Dataset):
             )
         processing_type = processing_type_items[0].value
 
-        instance._processing_procedure: Union[  # noqa: B032
-            SpecimenCollection,
-            SpecimenSampling,
-            SpecimenStaining,
-            SpecimenProcessing,
-        ]
-        if processing_type == codes.SCT.SpecimenCollection:
-            collection_items = sequence.find(codes.SCT.SpecimenCollection)
-            if len(collection_items) != 1:
-                raise ValueError(
-                    'Specimen Preparation Step Content Item Sequence must '
-                    'contain exactly one content item "Specimen Collection" '
-                    'when processing type is "Specimen Collection".'
-                )
-            instance._processing_procedure = SpecimenCollection(
-                procedure=collection_items[0].value
-            )
-        elif processing_type == codes.SCT.SpecimenProcessing:
-            description_items = sequence.find(
-                codes.DCM.ProcessingStepDescription
-            )
-            if len(description_items) != 1:
-                raise ValueError(
-                    'Specimen Preparation Step Content Item Sequence must '
-                    'contain exactly one content item "Processing Step '
-                    'Description" when processing type is "Specimen '
-                    'Processing".'
-                )
-            instance._processing_procedure = SpecimenProcessing(
-                description=description_items[0].value
-            )
-        elif processing_type == codes.SCT.Staining:
-            substance_items = sequence.find(codes.SCT.UsingSubstance)
-            if len(substance_items) == 0:
-                raise ValueError(
-                    'Specimen Preparation Step Content Item Sequence must '
-                    'contain one or more content item "Using Substance" '
-                    'when processing type is "Staining".'
-                )
-            instance._processing_procedure = SpecimenStaining(
-                substances=[item.value for item in substance_items]
-            )
-        elif processing_type == codes.SCT.SamplingOfTissueSpecimen:
-            sampling_method_items = sequence.find(codes.DCM.SamplingMethod)
-            if len(sampling_method_items) != 1:
-                raise ValueError(
-                    'Specimen Preparation Step Content Item Sequence must '
-                    'contain exactly one content item "Sampling Method" '
-                    'when processing type is "Sampling of Tissue Specimen".'
-                )
-            parent_specimen_id_items = sequence.find(
-                codes.DCM.ParentSpecimenIdentifier
-            )
-            if len(parent_specimen_id_items) != 1:
-                raise ValueError(
-                    'Specimen Preparation Step Content Item Sequence must '
-                    'contain exactly one content item "Parent Specimen '
-                    'Identifier" when processing type is "Sampling of Tissue '
-                    'Specimen".'
-                )
-            parent_specimen_type_items = sequence.find(
-                codes.DCM.ParentSpecimenType
-            )
-            if len(parent_specimen_type_items) != 1:
-                raise ValueError(
-                    'Specimen Preparation Step Content Item Sequence must '
-                    'contain exactly one content item "Parent Specimen '
-                    'Type" when processing type is "Sampling of Tissue '
-                    'Specimen".'
-                )
-            issuer_of_parent_specimen_type_items = sequence.find(
-                codes.DCM.IssuerOfParentSpecimenIdentifier
-            )
-            if len(issuer_of_parent_specimen_type_items) > 0:
-                issuer = issuer_of_parent_specimen_type_items[0].value
-            else:
-                issuer = None
-            instance._processing_procedure = SpecimenSampling(
-                method=sampling_method_items[0].value,
-                parent_specimen_id=parent_specimen_id_items[0].value,
-                parent_specimen_type=parent_specimen_type_items[0].value,
-                issuer_of_parent_specimen_id=issuer
-            )
-        else:
+        try:
+            get_processing_procedure = _PROCESSING_PROCEDURE_GETTERS[
+                _get_code_key(processing_type)
+            ]
+        except KeyError:
             raise ValueError(
                 'Specimen Preparation Step Content Item Sequence must contain '
                 'a content item "Processing Type" with one of the following '
                 'values: "Specimen Collection", "Specimen Processing", '
                 '"Staining", or "Sampling of Tissue Specimen".'
             )
+        instance._processing_procedure = get_processing_procedure(sequence)
 
         cast(SpecimenPreparationStep, instance)
         return instance
@@ -1740,12 +1801,14 @@ class ReferencedImageSequence(DataElementSequence):
                 )
 
         # Check for duplicate instances
-        sop_uid_counts = Counter(
-            ins.SOPInstanceUID for ins in referenced_images
-        )
-        most_common, max_count = sop_uid_counts.most_common(1)[0]
-        if max_count > 1:
-            raise ValueError("Found duplicate instances in referenced images.")
+        sop_instance_uids: Set[str] = set()
+        for ins in referenced_images:
+            sop_instance_uid = ins.SOPInstanceUID
+            if sop_instance_uid in sop_instance_uids:
+                raise ValueError(
+                    "Found duplicate instances in referenced images."
+                )
+            sop_instance_uids.add(sop_instance_uid)
 
         multiple_images = len(referenced_images) > 1
         if referenced_frame_number is not None:
@@ -1763,8 +1826,9 @@ class ReferencedImageSequence(DataElementSequence):
                 _referenced_frame_numbers = referenced_frame_number
             else:
                 _referenced_frame_numbers = [referenced_frame_number]
+            number_of_frames = int(referenced_images[0].NumberOfFrames)
             for f in _referenced_frame_numbers:
-                if f < 1 or f > referenced_images[0].NumberOfFrames:
+                if f < 1 or f > number_of_frames:
                     raise ValueError(
                         f'Frame number {f} is invalid for referenced '
                         'image.'
@@ -30,6 +30,7 @@ from highdicom.sr.sop import (
     srread,
 )
 from highdicom.sr.templates import (
+    IMAGE_LIBRARY_REQUIRED_TAGS,
     AlgorithmIdentification,
     DeviceObserverIdentifyingAttributes,
     ImageLibrary,
@@ -111,6 +112,7 @@ __all__ = [
     'FindingSite',
     'GraphicTypeValues',
     'GraphicTypeValues3D',
+    'IMAGE_LIBRARY_REQUIRED_TAGS',
     'ImageContentItem',
     'ImageLibrary',
     'ImageLibraryEntryDescriptors',
@@ -1,12 +1,15 @@
 from copy import deepcopy
 import logging
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
 from pydicom.dataset import Dataset
-from pydicom.sr.coding import Code
+from pydicom.sr.coding import Code, snomed_mapping
 
 logger = logging.getLogger(__name__)
 
+# Hashable key of a code (see _get_code_key)
+_CodeKey = Tuple[str, str, Optional[str]]
+
 
 class CodedConcept(Dataset):
 
@@ -65,6 +68,8 @@ class CodedConcept(Dataset):
             whether `self` and `other` are considered equal
 
         """
+        if other is self:
+            return True
         if isinstance(other, (Code, CodedConcept)):
             this = Code(
                 self.value,
@@ -195,3 +200,30 @@ class CodedConcept(Dataset):
     def scheme_version(self) -> Optional[str]:
         """Union[str, None]: version of the coding scheme (if specified)"""
         return getattr(self, 'CodingSchemeVersion', None)
+
+
+def _get_code_key(code: Union[Code, CodedConcept]) -> _CodeKey:
+    """Get a hashable key for a code that is consistent with code equality.
+
+    Codes of the deprecated SNOMED-RT coding scheme ("SRT") are mapped to
+    the corresponding SNOMED-CT ("SCT") codes, such that codes that compare
+    equal also produce the same key.
+
+    Parameters
+    ----------
+    code: Union[highdicom.sr.CodedConcept, pydicom.sr.coding.Code]
+        Code
+
+    Returns
+    -------
+    Tuple[str, str, Union[str, None]]
+        Coding scheme designator, code value, and coding scheme version
+
+    """
+    scheme_designator = code.scheme_designator
+    value = code.value
+    if scheme_designator == 'SRT':
+        mapped_value = snomed_mapping['SRT'].get(value)
+        if mapped_value is not None:
+            return ('SCT', mapped_value, code.scheme_version)
+    return (scheme_designator, value, code.scheme_version)
@@ -2,13 +2,25 @@
 import collections
 import logging
 from copy import deepcopy
-from typing import cast, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from itertools import islice
+from typing import (
+    cast,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from pydicom.dataset import Dataset
 from pydicom.sr.coding import Code
 from pydicom.sr.codedict import codes
 
-from highdicom.sr.coding import CodedConcept
+from highdicom.sr.coding import CodedConcept, _CodeKey, _get_code_key
 from highdicom.sr.content import (
     FindingSite,
     LongitudinalTemporalOffsetFromEvent,
@@ -55,6 +67,24 @@ DEFAULT_LANGUAGE = CodedConcept(
     meaning='English (United States)'
 )
 _REGION_IN_SPACE = Code('130488', 'DCM', 'Region in Space')
+
+# Attributes of image datasets that are accessed by ImageLibrary and
+# ImageLibraryEntryDescriptors
+IMAGE_LIBRARY_REQUIRED_TAGS = (
+    'SOPClassUID',
+    'SOPInstanceUID',
+    'Modality',
+    'FrameOfReferenceUID',
+    'Rows',
+    'Columns',
+    'PixelSpacing',
+    'ImageOrientationPatient',
+    'ImagePositionPatient',
+    'SliceThickness',
+    'SpacingBetweenSlices',
+    'ImagerPixelSpacing',
+    'PatientOrientation',
+)
 _SOURCE = CodedConcept(
     value='260753009',
     scheme_designator='SCT',
@@ -98,7 +128,7 @@ def _count_roi_items(
             'SR Content Item does not represent a measurement group '
             'because it does not have value type CONTAINER.'
         )
-    if group_item.name == codes.DCM.MeasurementGroup:
+    if group_item.name != codes.DCM.MeasurementGroup:
         raise ValueError(
             'SR Content Item does not represent a measurement group '
             'because it does not have name "Measurement Group".'
@@ -134,13 +164,19 @@ def _count_roi_items(
     )
 
 
-def _contains_planar_rois(group_item: ContainerContentItem) -> bool:
+def _contains_planar_rois(
+    group_item: ContainerContentItem,
+    roi_item_counts: Optional[Tuple[int, int, int, int, int]] = None
+) -> bool:
     """Checks whether a measurement group item contains planar ROIs.
 
     Parameters
     ----------
     group_item: highdicom.sr.ContainerContentItem
         SR Content Item representing a "Measurement Group"
+    roi_item_counts: Union[Tuple[int, int, int, int, int], None], optional
+        Numbers of ROI content items of `group_item` as returned by
+        :func:`_count_roi_items`, if already known
 
     Returns
     -------
@@ -149,9 +185,11 @@ def _contains_planar_rois(group_item: ContainerContentItem) -> bool:
         SCOORD, SCOORD3D, IMAGE, or COMPOSITE representing planar ROIs
 
     """
+    if roi_item_counts is None:
+        roi_item_counts = _count_roi_items(group_item)
     n_image_region_items, n_volume_surface_items, n_referenced_segment_items, \
         n_referenced_segmentation_frame_items, n_region_in_space_items = \
-        _count_roi_items(group_item)
+        roi_item_counts
 
     if (
             n_image_region_items == 1 or
@@ -165,13 +203,19 @@ def _contains_planar_rois(group_item: ContainerContentItem) -> bool:
     return False
 
 
-def _contains_volumetric_rois(group_item: ContainerContentItem) -> bool:
+def _contains_volumetric_rois(
+    group_item: ContainerContentItem,
+    roi_item_counts: Optional[Tuple[int, int, int, int, int]] = None
+) -> bool:
     """Checks whether a measurement group item contains volumetric ROIs.
 
     Parameters
     ----------
     group_item: highdicom.sr.ContainerContentItem
         SR Content Item representing a "Measurement Group"
+    roi_item_counts: Union[Tuple[int, int, int, int, int], None], optional
+        Numbers of ROI content items of `group_item` as returned by
+        :func:`_count_roi_items`, if already known
 
     Returns
     -------
@@ -180,9 +224,11 @@ def _contains_volumetric_rois(group_item: ContainerContentItem) -> bool:
         SCOORD, SCOORD3D, IMAGE, or COMPOSITE representing volumetric ROIs
 
     """
+    if roi_item_counts is None:
+        roi_item_counts = _count_roi_items(group_item)
     n_image_region_items, n_volume_surface_items, n_referenced_segment_items, \
         n_referenced_segmentation_frame_items, n_region_in_space_items = \
-        _count_roi_items(group_item)
+        roi_item_counts
 
     if (
             n_image_region_items > 1 or
@@ -196,8 +242,34 @@ def _contains_volumetric_rois(group_item: ContainerContentItem) -> bool:
     return False
 
 
+def _classify_measurement_group(group_item: ContainerContentItem) -> str:
+    """Determine the kind of a measurement group from its ROI content items.
+
+    Parameters
+    ----------
+    group_item: highdicom.sr.ContainerContentItem
+        SR Content Item representing a "Measurement Group"
+
+    Returns
+    -------
+    str
+        ``"planar"`` if the group contains planar ROIs (see
+        :func:`_contains_planar_rois`), ``"volumetric"`` if it contains
+        volumetric ROIs (see :func:`_contains_volumetric_rois`), and
+        ``"image"`` otherwise
+
+    """
+    roi_item_counts = _count_roi_items(group_item)
+    if _contains_planar_rois(group_item, roi_item_counts):
+        return 'planar'
+    if _contains_volumetric_rois(group_item, roi_item_counts):
+        return 'volumetric'
+    return 'image'
+
+
 def _get_planar_roi_reference_item(
     group_item: ContainerContentItem,
+    index: Optional[Dict[_CodeKey, List[ContentItem]]] = None
 ) -> Tuple[Code, ContentItem]:
     """Get the content item representing a planar measurement group's ROI.
 
@@ -205,6 +277,9 @@ def _get_planar_roi_reference_item(
     ----------
     group_item: highdicom.sr.ContainerContentItem
         SR Content Item representing a "Planar ROI Measurement Group"
+    index: Union[Dict[Tuple[str, str, Union[str, None]], List[highdicom.sr.ContentItem]], None], optional
+        Index of the content sequence of `group_item` (see
+        :func:`_index_by_name`)
 
     Returns
     -------
@@ -213,10 +288,11 @@ def _get_planar_roi_reference_item(
     highdicom.sr.ContentItem
         Content item that defines the reference to the ROI.
 
-    """
+    """  # noqa: E501
     reference_type, items = _get_roi_reference_items(
         group_item,
-        PlanarROIMeasurementsAndQualitativeEvaluations._allowed_roi_reference_types  # noqa: E501
+        PlanarROIMeasurementsAndQualitativeEvaluations._allowed_roi_reference_types,  # noqa: E501
+        index=index
     )
     if len(items) > 1:
         raise RuntimeError(
@@ -228,6 +304,7 @@ def _get_planar_roi_reference_item(
 
 def _get_volumetric_roi_reference_items(
     group_item: ContainerContentItem,
+    index: Optional[Dict[_CodeKey, List[ContentItem]]] = None
 ) -> Tuple[Code, List[ContentItem]]:
     """Get the content items representing a volumetric measurement group's ROI.
 
@@ -235,6 +312,9 @@ def _get_volumetric_roi_reference_items(
     ----------
     group_item: highdicom.sr.ContainerContentItem
         SR Content Item representing a "Volumetric ROI Measurement Group"
+    index: Union[Dict[Tuple[str, str, Union[str, None]], List[highdicom.sr.ContentItem]], None], optional
+        Index of the content sequence of `group_item` (see
+        :func:`_index_by_name`)
 
     Returns
     -------
@@ -243,16 +323,18 @@ def _get_volumetric_roi_reference_items(
     List[highdicom.sr.ContentItem]
         Content items that defines the reference to the ROI.
 
-    """
+    """  # noqa: E501
     return _get_roi_reference_items(
         group_item,
-        VolumetricROIMeasurementsAndQualitativeEvaluations._allowed_roi_reference_types  # noqa: E501
+        VolumetricROIMeasurementsAndQualitativeEvaluations._allowed_roi_reference_types,  # noqa: E501
+        index=index
     )
 
 
 def _get_roi_reference_items(
     group_item: ContainerContentItem,
-    allowed_reference_types: Iterable[Code]
+    allowed_reference_types: Iterable[Code],
+    index: Optional[Dict[_CodeKey, List[ContentItem]]] = None
 ) -> Tuple[Code, List[ContentItem]]:
     """Get the content items representing a measurement group's roi reference.
 
@@ -262,6 +344,10 @@ def _get_roi_reference_items(
         SR Content Item representing a "Measurement Group"
     allowed_reference_types: Iterable[Code]
         Codes that are allowed as concept names for ROI references.
+    index: Union[Dict[Tuple[str, str, Union[str, None]], List[highdicom.sr.ContentItem]], None], optional
+        Index of the content sequence of `group_item` (see
+        :func:`_index_by_name`). If provided, only the items with one of the
+        allowed names are considered rather than the entire content sequence.
 
     Returns
     -------
@@ -276,7 +362,7 @@ def _get_roi_reference_items(
         If no content item representing a valid content type is found. If
         multiple valid content items are found with different concept names.
 
-    """
+    """  # noqa: E501
     ref_type_value_type_map = {
         codes.DCM.ImageRegion: [
             ValueTypeValues.SCOORD,
@@ -287,9 +373,18 @@ def _get_roi_reference_items(
         codes.DCM.ReferencedSegmentationFrame: [ValueTypeValues.IMAGE],
         _REGION_IN_SPACE: [ValueTypeValues.COMPOSITE],
     }
+    candidate_items: Iterable[ContentItem]
+    if index is None:
+        candidate_items = group_item.ContentSequence
+    else:
+        candidate_items = [
+            item
+            for allowed_type in allowed_reference_types
+            for item in index.get(_get_code_key(allowed_type), [])
+        ]
     returned_items = []
     reference_type = None
-    for item in group_item.ContentSequence:
+    for item in candidate_items:
         if item.relationship_type != RelationshipTypeValues.CONTAINS:
             # All ROI reference content items have relationship type CONTAINS
             continue
@@ -323,175 +418,350 @@ def _get_roi_reference_items(
     return reference_type, returned_items
 
 
-def _contains_code_items(
-    parent_item: ContentItem,
-    name: Union[Code, CodedConcept],
-    value: Optional[Union[Code, CodedConcept]] = None,
-    relationship_type: Optional[RelationshipTypeValues] = None
-) -> bool:
-    """Checks whether an item contains a specific item with value type CODE.
+# Keys of the concept names of content items that are used to filter
+# measurement groups
+_FINDING_KEY = _get_code_key(codes.DCM.Finding)
+_FINDING_SITE_KEY = _get_code_key(codes.SCT.FindingSite)
+_TRACKING_UID_KEY = _get_code_key(codes.DCM.TrackingUniqueIdentifier)
+
+# Value types of SR Content Items that can have a given type of graphic type
+_GRAPHIC_TYPE_VALUE_TYPES = {
+    GraphicTypeValues: ValueTypeValues.SCOORD.value,
+    GraphicTypeValues3D: ValueTypeValues.SCOORD3D.value,
+}
+
+# Keys of ROI reference types
+_IMAGE_REGION_KEY = _get_code_key(codes.DCM.ImageRegion)
+_REFERENCED_SEGMENTATION_FRAME_KEY = _get_code_key(
+    codes.DCM.ReferencedSegmentationFrame
+)
+_REFERENCED_SEGMENT_KEY = _get_code_key(codes.DCM.ReferencedSegment)
+
+# Keys of ROI reference types that directly reference a SOP instance
+_PLANAR_DIRECT_REF_TYPES = frozenset({
+    _REFERENCED_SEGMENTATION_FRAME_KEY,
+    _get_code_key(_REGION_IN_SPACE),
+})
+_VOLUMETRIC_DIRECT_REF_TYPES = frozenset({
+    _REFERENCED_SEGMENT_KEY,
+    _get_code_key(_REGION_IN_SPACE),
+})
+# Keys of ROI reference types that are specified by graphic data
+_GRAPHIC_REF_TYPES = frozenset({
+    _IMAGE_REGION_KEY,
+    _get_code_key(codes.DCM.VolumeSurface),
+})
+
+
+def _index_by_name(
+    sequence: Sequence[ContentItem]
+) -> Dict[_CodeKey, List[ContentItem]]:
+    """Index SR Content Items by their concept name.
 
     Parameters
     ----------
-    parent_item: highdicom.sr.ContentItem
-        Parent SR Content Item
-    name: Union[highdicom.sr.CodedConcept, pydicom.sr.coding.Code]
-        Name of the child SR Content Item
-    value: Union[highdicom.sr.CodedConcept, pydicom.sr.coding.Code, None], optional
-        Code value of the child SR Content Item
-    relationship_type: Union[highdicom.sr.RelationshipTypeValues, None], optional
-        Relationship between child and parent SR Content Item
+    sequence: Sequence[highdicom.sr.ContentItem]
+        SR Content Items, e.g., the content sequence of a measurement group
 
     Returns
     -------
-    bool
-        Whether any of the SR Content Items contained in `parent_item`
-        match the filter criteria
+    Dict[Tuple[str, str, Union[str, None]], List[highdicom.sr.ContentItem]]
+        SR Content Items grouped by the key of their concept name (see
+        :func:`_get_code_key`)
 
-    """  # noqa: E501
-    matched_items = find_content_items(
-        parent_item,
-        name=name,
-        value_type=ValueTypeValues.CODE,
-        relationship_type=relationship_type
-    )
-    for item in matched_items:
-        if value is not None:
-            if item.value == value:
-                return True
-        else:
-            return True
-    return False
+    """
+    index: Dict[_CodeKey, List[ContentItem]] = \
+        collections.defaultdict(list)
+    for item in sequence:
+        index[_get_code_key(item.name)].append(item)
+    return index
 
 
-def _contains_text_items(
+def _find_child_items(
     parent_item: ContentItem,
-    name: Union[Code, CodedConcept],
-    value: Optional[str] = None,
-    relationship_type: Optional[RelationshipTypeValues] = None
-) -> bool:
-    """Checks whether an item contains a specific item with value type TEXT.
+    name: Optional[Union[Code, CodedConcept]],
+    value_type: ValueTypeValues,
+    relationship_type: Optional[RelationshipTypeValues] = None,
+    index: Optional[Dict[_CodeKey, List[ContentItem]]] = None
+) -> List[ContentItem]:
+    """Find child content items of an item that match a given query.
 
     Parameters
     ----------
     parent_item: highdicom.sr.ContentItem
         Parent SR Content Item
-    name: Union[highdicom.sr.CodedConcept, pydicom.sr.coding.Code]
+    name: Union[highdicom.sr.CodedConcept, pydicom.sr.coding.Code, None]
         Name of the child SR Content Item
-    value: str, optional
-        Text value of the child SR Content Item
+    value_type: highdicom.sr.ValueTypeValues
+        Value type of the child SR Content Item
     relationship_type: Union[highdicom.sr.RelationshipTypeValues, None], optional
         Relationship between child and parent SR Content Item
+    index: Union[Dict[Tuple[str, str, Union[str, None]], List[highdicom.sr.ContentItem]], None], optional
+        Index of the content sequence of `parent_item` as returned by
+        :func:`_index_by_name`. If provided, only the items with matching
+        name are considered rather than the entire content sequence.
 
     Returns
     -------
-    bool
-        Whether any of the SR Content Items contained in `parent_item`
-        match the filter criteria
+    List[highdicom.sr.ContentItem]
+        Child SR Content Items that match the query
 
     """  # noqa: E501
-    matched_items = find_content_items(
-        parent_item,
-        name=name,
-        value_type=ValueTypeValues.TEXT,
+    if index is None or name is None:
+        return find_content_items(
+            parent_item,
+            name=name,
+            value_type=value_type,
+            relationship_type=relationship_type
+        )
+    return _filter_items(
+        index.get(_get_code_key(name), []),
+        value_type=value_type,
         relationship_type=relationship_type
     )
-    for item in matched_items:
-        if value is not None:
-            if item.TextValue == value:
-                return True
-        else:
-            return True
-    return False
 
 
-def _contains_uidref_items(
-    parent_item: ContentItem,
-    name: Union[Code, CodedConcept],
-    value: Optional[str] = None,
+def _filter_items(
+    items: Iterable[ContentItem],
+    value_type: ValueTypeValues,
     relationship_type: Optional[RelationshipTypeValues] = None
-) -> bool:
-    """Checks whether an item contains a specific item with value type UIDREF.
+) -> List[ContentItem]:
+    """Filter content items by value type and relationship type.
 
     Parameters
     ----------
-    parent_item: highdicom.sr.ContentItem
-        Parent SR Content Item
-    name: Union[highdicom.sr.CodedConcept, pydicom.sr.coding.Code]
-        Name of the child SR Content Item
-    value: Union[str, None], optional
-        UID value of the child SR Content Item
+    items: Iterable[highdicom.sr.ContentItem]
+        SR Content Items
+    value_type: highdicom.sr.ValueTypeValues
+        Value type of the SR Content Items
     relationship_type: Union[highdicom.sr.RelationshipTypeValues, None], optional
-        Relationship between child and parent SR Content Item
+        Relationship between the SR Content Items and their parent
 
     Returns
     -------
-    bool
-        Whether any of the SR Content Items contained in `parent_item`
-        match the filter criteria
+    List[highdicom.sr.ContentItem]
+        SR Content Items that match the query
 
     """  # noqa: E501
-    matched_items = find_content_items(
-        parent_item,
-        name=name,
-        value_type=ValueTypeValues.UIDREF,
-        relationship_type=relationship_type
-    )
-    for item in matched_items:
-        if value is not None:
-            if item.UID == value:
-                return True
-        else:
-            return True
-    return False
+    return [
+        item for item in items
+        if (
+            item.ValueType == value_type.value and
+            (
+                relationship_type is None or
+                item.get('RelationshipType') == relationship_type.value
+            )
+        )
+    ]
 
 
-def _contains_image_items(
-    parent_item: ContentItem,
-    name: Union[Code, CodedConcept],
-    referenced_sop_class_uid: Union[str, None] = None,
-    referenced_sop_instance_uid: Union[str, None] = None,
-    relationship_type: Optional[RelationshipTypeValues] = None
-) -> bool:
-    """Check whether an item contains a specific item with value type IMAGE.
+class _ImageReferenceIndex:
+
+    """Index of the SOP instances referenced by SR Content Items of value type
+    IMAGE.
+
+    Allows checking whether any of the items references a given SOP
+    instance via set lookups rather than by comparing the UIDs of each item.
+
+    """
+
+    def __init__(self, image_items: Iterable[ContentItem]) -> None:
+        """
+        Parameters
+        ----------
+        image_items: Iterable[highdicom.sr.ContentItem]
+            SR Content Items of value type IMAGE
+
+        """
+        self.uid_pairs: Set[Tuple[str, str]] = set()
+        self.sop_class_uids: Set[str] = set()
+        self.sop_instance_uids: Set[str] = set()
+        for item in image_items:
+            ref_item = item.ReferencedSOPSequence[0]
+            sop_class_uid = ref_item.ReferencedSOPClassUID
+            sop_instance_uid = ref_item.ReferencedSOPInstanceUID
+            self.uid_pairs.add((sop_class_uid, sop_instance_uid))
+            self.sop_class_uids.add(sop_class_uid)
+            self.sop_instance_uids.add(sop_instance_uid)
+
+    def contains(
+        self,
+        referenced_sop_class_uid: Optional[str] = None,
+        referenced_sop_instance_uid: Optional[str] = None
+    ) -> bool:
+        """Check whether any item references a matching SOP instance.
+
+        Parameters
+        ----------
+        referenced_sop_class_uid: Union[str, None], optional
+            SOP Class UID referenced by the content item
+        referenced_sop_instance_uid: Union[str, None], optional
+            SOP Instance UID referenced by the content item
+
+        Returns
+        -------
+        bool
+            Whether any of the indexed items match the given UIDs. UIDs that
+            are ``None`` match any value.
+
+        """
+        if referenced_sop_class_uid is not None:
+            if referenced_sop_instance_uid is not None:
+                return (
+                    (referenced_sop_class_uid, referenced_sop_instance_uid) in
+                    self.uid_pairs
+                )
+            return referenced_sop_class_uid in self.sop_class_uids
+        if referenced_sop_instance_uid is not None:
+            return referenced_sop_instance_uid in self.sop_instance_uids
+        return len(self.uid_pairs) > 0
+
+
+def _get_selected_from_references(
+    ref_items: Iterable[ContentItem]
+) -> _ImageReferenceIndex:
+    """Index the images that regions of interest were selected from.
 
     Parameters
     ----------
-    parent_item: highdicom.sr.ContentItem
-        Parent SR Content Item
-    name: Union[highdicom.sr.CodedConcept, pydicom.sr.coding.Code]
-        Name of the child SR Content Item
-    referenced_sop_class_uid: Union[str, None], optional
-        SOP Class UID referenced by the content item
-    referenced_sop_instance_uid: Union[str, None], optional
-        SOP Instance UID referenced by the content item
-    relationship_type: Union[highdicom.sr.RelationshipTypeValues, None], optional
-        Relationship between child and parent SR Content Item
+    ref_items: Iterable[highdicom.sr.ContentItem]
+        SR Content Items representing the ROI references of a measurement
+        group
 
     Returns
     -------
-    bool
-        Whether any of the SR Content Items contained in `parent_item`
-        match the filter criteria
+    _ImageReferenceIndex
+        Index of the IMAGE content items that the SCOORD items among
+        `ref_items` were selected from (SCOORD3D items do not contain direct
+        UID references)
 
-    """  # noqa: E501
-    matched_items = find_content_items(
-        parent_item,
-        name=name,
-        value_type=ValueTypeValues.IMAGE,
-        relationship_type=relationship_type
-    )
-    for item in matched_items:
-        if referenced_sop_class_uid is not None:
-            if item.referenced_sop_class_uid != referenced_sop_class_uid:
-                continue
-        if referenced_sop_instance_uid is not None:
-            if referenced_sop_instance_uid is not None:
-                found_uid = item.referenced_sop_instance_uid
-                if found_uid != referenced_sop_instance_uid:
-                    continue
-        return True
-    return False
+    """
+    image_items: List[ContentItem] = []
+    for ref_item in ref_items:
+        if ref_item.ValueType == ValueTypeValues.SCOORD.value:
+            image_items.extend(
+                _find_child_items(
+                    ref_item,
+                    name=None,
+                    value_type=ValueTypeValues.IMAGE,
+                    relationship_type=RelationshipTypeValues.SELECTED_FROM
+                )
+            )
+    return _ImageReferenceIndex(image_items)
+
+
+class _MeasurementGroupIndex:
+
+    """Index of the content items of a measurement group that are relevant
+    for filtering measurement groups.
+
+    The index is built lazily: the content sequence of the group is only
+    traversed once a filter criterion requires it, and subsequently filter
+    criteria can be checked via dictionary and set lookups.
+
+    """
+
+    def __init__(self, group_item: ContainerContentItem) -> None:
+        """
+        Parameters
+        ----------
+        group_item: highdicom.sr.ContainerContentItem
+            SR Content Item representing a "Measurement Group"
+
+        """
+        self._group_item = group_item
+        self._image_references: Dict[_CodeKey, _ImageReferenceIndex] = {}
+        self._items_by_name: Optional[Dict[_CodeKey, List[ContentItem]]] = None
+        self._findings: Optional[Set[_CodeKey]] = None
+        self._finding_sites: Optional[Set[_CodeKey]] = None
+        self._tracking_uids: Optional[Set[str]] = None
+
+    @property
+    def items_by_name(self) -> Dict[_CodeKey, List[ContentItem]]:
+        """Dict[Tuple[str, str, Union[str, None]], List[highdicom.sr.ContentItem]]:
+        Content items of the group indexed by name
+
+        """  # noqa: E501
+        if self._items_by_name is None:
+            self._items_by_name = _index_by_name(
+                self._group_item.ContentSequence
+            )
+        return self._items_by_name
+
+    @property
+    def findings(self) -> Set[_CodeKey]:
+        """Set[Tuple[str, str, Union[str, None]]]: Keys of findings"""
+        if self._findings is None:
+            self._findings = {
+                _get_code_key(item.value)
+                for item in _filter_items(
+                    self.items_by_name.get(_FINDING_KEY, []),
+                    value_type=ValueTypeValues.CODE,
+                    relationship_type=RelationshipTypeValues.CONTAINS
+                )
+            }
+        return self._findings
+
+    @property
+    def finding_sites(self) -> Set[_CodeKey]:
+        """Set[Tuple[str, str, Union[str, None]]]: Keys of finding sites"""
+        if self._finding_sites is None:
+            self._finding_sites = {
+                _get_code_key(item.value)
+                for item in _filter_items(
+                    self.items_by_name.get(_FINDING_SITE_KEY, []),
+                    value_type=ValueTypeValues.CODE,
+                    relationship_type=RelationshipTypeValues.HAS_CONCEPT_MOD
+                )
+            }
+        return self._finding_sites
+
+    @property
+    def tracking_uids(self) -> Set[str]:
+        """Set[str]: Tracking unique identifiers"""
+        if self._tracking_uids is None:
+            self._tracking_uids = {
+                item.UID
+                for item in _filter_items(
+                    self.items_by_name.get(_TRACKING_UID_KEY, []),
+                    value_type=ValueTypeValues.UIDREF,
+                    relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
+                )
+            }
+        return self._tracking_uids
+
+    def get_image_references(
+        self,
+        name: Union[Code, CodedConcept]
+    ) -> _ImageReferenceIndex:
+        """Get the images referenced by IMAGE items of the group.
+
+        Parameters
+        ----------
+        name: Union[highdicom.sr.CodedConcept, pydicom.sr.coding.Code]
+            Name of the IMAGE content items (with relationship type CONTAINS)
+
+        Returns
+        -------
+        _ImageReferenceIndex
+            Index of the referenced images
+
+        """
+        key = _get_code_key(name)
+        try:
+            return self._image_references[key]
+        except KeyError:
+            references = _ImageReferenceIndex(
+                _find_child_items(
+                    self._group_item,
+                    name=name,
+                    value_type=ValueTypeValues.IMAGE,
+                    relationship_type=RelationshipTypeValues.CONTAINS,
+                    index=self.items_by_name
+                )
+            )
+            self._image_references[key] = references
+            return references
 
 
 def _get_coded_modality(sop_class_uid: str) -> Code:
@@ -1277,6 +1547,46 @@ class PersonObserverIdentifyingAttributes(Template):
         highdicom.sr.PersonObserverIdentifyingAttributes
             Content Sequence containing SR Content Items
 
+        """
+        return cls.from_sequence_range(
+            sequence,
+            start=0,
+            stop=len(sequence),
+            is_root=is_root
+        )
+
+    @classmethod
+    def from_sequence_range(
+        cls,
+        sequence: Sequence[Dataset],
+        start: int,
+        stop: int,
+        is_root: bool = False
+    ) -> 'PersonObserverIdentifyingAttributes':
+        """Construct object from a range of items of a sequence of datasets.
+
+        Equivalent to ``from_sequence(sequence[start:stop])``, but iterates
+        over the items in place instead of creating a copy of the sequence.
+
+        Parameters
+        ----------
+        sequence: Sequence[pydicom.dataset.Dataset]
+            Datasets representing SR Content Items of template
+            TID 1003 "Person Observer Identifying Attributes"
+        start: int
+            Index of the first dataset in `sequence`
+        stop: int
+            Index of the dataset in `sequence` at which to stop (exclusive)
+        is_root: bool, optional
+            Whether the sequence is used to contain SR Content Items that are
+            intended to be added to an SR document at the root of the document
+            content tree
+
+        Returns
+        -------
+        highdicom.sr.PersonObserverIdentifyingAttributes
+            Content Sequence containing SR Content Items
+
         """
         attr_codes = [
             ('name', codes.DCM.PersonObserverName),
@@ -1289,7 +1599,7 @@ class PersonObserverIdentifyingAttributes(Template):
              codes.DCM.PersonObserverRoleInThisProcedure),
         ]
         kwargs = {}
-        for dataset in sequence:
+        for dataset in islice(sequence, start, stop):
             dataset_copy = deepcopy(dataset)
             content_item = ContentItem._from_dataset_derived(dataset_copy)
             for param, name in attr_codes:
@@ -1513,6 +1823,46 @@ class DeviceObserverIdentifyingAttributes(Template):
         highdicom.sr.templates.DeviceObserverIdentifyingAttributes
             Content Sequence containing SR Content Items
 
+        """
+        return cls.from_sequence_range(
+            sequence,
+            start=0,
+            stop=len(sequence),
+            is_root=is_root
+        )
+
+    @classmethod
+    def from_sequence_range(
+        cls,
+        sequence: Sequence[Dataset],
+        start: int,
+        stop: int,
+        is_root: bool = False
+    ) -> 'DeviceObserverIdentifyingAttributes':
+        """Construct object from a range of items of a sequence of datasets.
+
+        Equivalent to ``from_sequence(sequence[start:stop])``, but iterates
+        over the items in place instead of creating a copy of the sequence.
+
+        Parameters
+        ----------
+        sequence: Sequence[pydicom.dataset.Dataset]
+            Datasets representing SR Content Items of template
+            TID 1004 "Device Observer Identifying Attributes"
+        start: int
+            Index of the first dataset in `sequence`
+        stop: int
+            Index of the dataset in `sequence` at which to stop (exclusive)
+        is_root: bool, optional
+            Whether the sequence is used to contain SR Content Items that are
+            intended to be added to an SR document at the root of the document
+            content tree
+
+        Returns
+        -------
+        highdicom.sr.templates.DeviceObserverIdentifyingAttributes
+            Content Sequence containing SR Content Items
+
         """
         attr_codes = [
             ('name', codes.DCM.DeviceObserverName),
@@ -1524,7 +1874,7 @@ class DeviceObserverIdentifyingAttributes(Template):
              codes.DCM.DeviceObserverPhysicalLocationDuringObservation),
         ]
         kwargs = {}
-        for dataset in sequence:
+        for dataset in islice(sequence, start, stop):
             dataset_copy = deepcopy(dataset)
             content_item = ContentItem._from_dataset_derived(dataset_copy)
             for param, name in attr_codes:
@@ -1667,12 +2017,52 @@ class SubjectContextFetus(Template):
         highdicom.sr.SubjectContextFetus
             Content Sequence containing SR Content Items
 
+        """
+        return cls.from_sequence_range(
+            sequence,
+            start=0,
+            stop=len(sequence),
+            is_root=is_root
+        )
+
+    @classmethod
+    def from_sequence_range(
+        cls,
+        sequence: Sequence[Dataset],
+        start: int,
+        stop: int,
+        is_root: bool = False
+    ) -> 'SubjectContextFetus':
+        """Construct object from a range of items of a sequence of datasets.
+
+        Equivalent to ``from_sequence(sequence[start:stop])``, but iterates
+        over the items in place instead of creating a copy of the sequence.
+
+        Parameters
+        ----------
+        sequence: Sequence[pydicom.dataset.Dataset]
+            Datasets representing SR Content Items of template
+            TID 1008 "Subject Context, Fetus"
+        start: int
+            Index of the first dataset in `sequence`
+        stop: int
+            Index of the dataset in `sequence` at which to stop (exclusive)
+        is_root: bool, optional
+            Whether the sequence is used to contain SR Content Items that are
+            intended to be added to an SR document at the root of the document
+            content tree
+
+        Returns
+        -------
+        highdicom.sr.SubjectContextFetus
+            Content Sequence containing SR Content Items
+
         """
         attr_codes = [
             ('subject_id', codes.DCM.SubjectID),
         ]
         kwargs = {}
-        for dataset in sequence:
+        for dataset in islice(sequence, start, stop):
             dataset_copy = deepcopy(dataset)
             content_item = ContentItem._from_dataset_derived(dataset_copy)
             for param, name in attr_codes:
@@ -1833,20 +2223,60 @@ class SubjectContextSpecimen(Template):
             Content Sequence containing SR Content Items
 
         """
-        attr_codes = [
-            ('uid', codes.DCM.SpecimenUID),
-            ('identifier', codes.DCM.SpecimenIdentifier),
-            ('container_identifier', codes.DCM.SpecimenContainerIdentifier),
-            ('specimen_type', codes.SCT.SpecimenType),
-        ]
-        kwargs = {}
-        for dataset in sequence:
-            dataset_copy = deepcopy(dataset)
-            content_item = ContentItem._from_dataset_derived(dataset_copy)
-            for param, name in attr_codes:
-                if content_item.name == name:
-                    kwargs[param] = content_item.value
-        return cls(**kwargs)
+        return cls.from_sequence_range(
+            sequence,
+            start=0,
+            stop=len(sequence),
+            is_root=is_root
+        )
+
+    @classmethod
+    def from_sequence_range(
+        cls,
+        sequence: Sequence[Dataset],
+        start: int,
+        stop: int,
+        is_root: bool = False
+    ) -> 'SubjectContextSpecimen':
+        """Construct object from a range of items of a sequence of datasets.
+
+        Equivalent to ``from_sequence(sequence[start:stop])``, but iterates
+        over the items in place instead of creating a copy of the sequence.
+
+        Parameters
+        ----------
+        sequence: Sequence[pydicom.dataset.Dataset]
+            Datasets representing SR Content Items of template
+            TID 1009 "Subject Context, Specimen"
+        start: int
+            Index of the first dataset in `sequence`
+        stop: int
+            Index of the dataset in `sequence` at which to stop (exclusive)
+        is_root: bool, optional
+            Whether the sequence is used to contain SR Content Items that are
+            intended to be added to an SR document at the root of the document
+            content tree
+
+        Returns
+        -------
+        highdicom.sr.SubjectContextSpecimen
+            Content Sequence containing SR Content Items
+
+        """
+        attr_codes = [
+            ('uid', codes.DCM.SpecimenUID),
+            ('identifier', codes.DCM.SpecimenIdentifier),
+            ('container_identifier', codes.DCM.SpecimenContainerIdentifier),
+            ('specimen_type', codes.SCT.SpecimenType),
+        ]
+        kwargs = {}
+        for dataset in islice(sequence, start, stop):
+            dataset_copy = deepcopy(dataset)
+            content_item = ContentItem._from_dataset_derived(dataset_copy)
+            for param, name in attr_codes:
+                if content_item.name == name:
+                    kwargs[param] = content_item.value
+        return cls(**kwargs)
 
 
 class SubjectContextDevice(Template):
@@ -2045,6 +2475,46 @@ class SubjectContextDevice(Template):
         highdicom.sr.SubjectContextDevice
             Content Sequence containing SR Content Items
 
+        """
+        return cls.from_sequence_range(
+            sequence,
+            start=0,
+            stop=len(sequence),
+            is_root=is_root
+        )
+
+    @classmethod
+    def from_sequence_range(
+        cls,
+        sequence: Sequence[Dataset],
+        start: int,
+        stop: int,
+        is_root: bool = False
+    ) -> 'SubjectContextDevice':
+        """Construct object from a range of items of a sequence of datasets.
+
+        Equivalent to ``from_sequence(sequence[start:stop])``, but iterates
+        over the items in place instead of creating a copy of the sequence.
+
+        Parameters
+        ----------
+        sequence: Sequence[pydicom.dataset.Dataset]
+            Datasets representing SR Content Items of template
+            TID 1010 "Subject Context, Device"
+        start: int
+            Index of the first dataset in `sequence`
+        stop: int
+            Index of the dataset in `sequence` at which to stop (exclusive)
+        is_root: bool, optional
+            Whether the sequence is used to contain SR Content Items that are
+            intended to be added to an SR document at the root of the document
+            content tree
+
+        Returns
+        -------
+        highdicom.sr.SubjectContextDevice
+            Content Sequence containing SR Content Items
+
         """
         attr_codes = [
             ('name', codes.DCM.DeviceSubjectName),
@@ -2056,7 +2526,7 @@ class SubjectContextDevice(Template):
              codes.DCM.DeviceSubjectPhysicalLocationDuringObservation),
         ]
         kwargs = {}
-        for dataset in sequence:
+        for dataset in islice(sequence, start, stop):
             dataset_copy = deepcopy(dataset)
             content_item = ContentItem._from_dataset_derived(dataset_copy)
             for param, name in attr_codes:
@@ -2145,7 +2615,9 @@ class SubjectContext(Template):
         elif self.subject_class == codes.DCM.Device:
             return SubjectContextDevice.from_sequence(sequence=self)
         else:
-            raise ValueError('Unexpected subject class "{item.meaning}".')
+            raise ValueError(
+                f'Unexpected subject class "{self.subject_class.meaning}".'
+            )
 
 
 class ObservationContext(Template):
@@ -4139,22 +4611,18 @@ class MeasurementReport(Template):
             container_item.ContentSequence = ContentSequence()
             for measurements in imaging_measurements:
                 if not isinstance(measurements, measurement_types):
+                    type_names = '", "'.join(
+                        t.__name__ for t in measurement_types
+                    )
                     raise TypeError(
                         'Measurements must have one of the following types: '
-                        '"{}"'.format(
-                            '", "'.join(
-                                [
-                                    t.__name__
-                                    for t in measurement_types
-                                ]
-                            )
-                        )
+                        f'"{type_names}"'
                     )
                 container_item.ContentSequence.extend(measurements)
         item.ContentSequence.append(container_item)
         super().__init__([item], is_root=True)
 
-    def _find_measurement_groups(self) -> List[ContainerContentItem]:
+    def _iter_measurement_groups(self) -> Iterator[ContainerContentItem]:
         root_item = self[0]
         imaging_measurement_items = find_content_items(
             root_item,
@@ -4162,13 +4630,44 @@ class MeasurementReport(Template):
             value_type=ValueTypeValues.CONTAINER
         )
         if len(imaging_measurement_items) == 0:
-            return []
-        items = find_content_items(
-            imaging_measurement_items[0],
-            name=codes.DCM.MeasurementGroup,
-            value_type=ValueTypeValues.CONTAINER
-        )
-        return cast(List[ContainerContentItem], items)
+            return
+        for item in imaging_measurement_items[0].ContentSequence:
+            if (
+                item.ValueType == ValueTypeValues.CONTAINER.value and
+                item.name == codes.DCM.MeasurementGroup
+            ):
+                yield cast(ContainerContentItem, item)
+
+    def _find_measurement_groups(self) -> List[ContainerContentItem]:
+        return list(self._iter_measurement_groups())
+
+    def _iter_measurement_groups_by_template(
+        self,
+        template_id: str
+    ) -> Iterator[Tuple[ContainerContentItem, bool]]:
+        """Iterate over measurement groups that may conform to a template.
+
+        Parameters
+        ----------
+        template_id: str
+            Template identifier
+
+        Returns
+        -------
+        Iterator[Tuple[highdicom.sr.ContainerContentItem, bool]]
+            Measurement groups that either have the given template identifier
+            or no template identifier at all, in document order, together
+            with a flag indicating whether the template identifier is
+            missing (in which case the caller needs to check the structure
+            of the group)
+
+        """
+        for group_item in self._iter_measurement_groups():
+            group_template_id = group_item.template_id
+            if group_template_id is None:
+                yield (group_item, True)
+            elif group_template_id == template_id:
+                yield (group_item, False)
 
     @classmethod
     def from_sequence(
@@ -4241,9 +4740,9 @@ class MeasurementReport(Template):
             Observer contexts
 
         """  # noqa: E501
-        root_item = self[0]
+        content_sequence = self[0].ContentSequence
         matches = [
-            (i, item) for i, item in enumerate(root_item.ContentSequence, 1)
+            (i, item) for i, item in enumerate(content_sequence, 1)
             if item.name == codes.DCM.ObserverType
         ]
         observer_contexts = []
@@ -4258,17 +4757,23 @@ class MeasurementReport(Template):
             try:
                 next_index = matches[i + 1][0]
             except IndexError:
-                next_index = -1
+                next_index = len(content_sequence) - 1
             if item.value == codes.DCM.Device:
-                attributes = DeviceObserverIdentifyingAttributes.from_sequence(
-                    sequence=root_item.ContentSequence[index:next_index]
+                attributes = DeviceObserverIdentifyingAttributes.from_sequence_range(  # noqa: E501
+                    sequence=content_sequence,
+                    start=index,
+                    stop=next_index
                 )
             elif item.value == codes.DCM.Person:
-                attributes = PersonObserverIdentifyingAttributes.from_sequence(
-                    sequence=root_item.ContentSequence[index:next_index]
+                attributes = PersonObserverIdentifyingAttributes.from_sequence_range(  # noqa: E501
+                    sequence=content_sequence,
+                    start=index,
+                    stop=next_index
                 )
             else:
-                raise ValueError('Unexpected observer type "{item.meaning}".')
+                raise ValueError(
+                    f'Unexpected observer type "{item.value.meaning}".'
+                )
             context = ObserverContext(
                 observer_type=item.value,
                 observer_identifying_attributes=attributes
@@ -4294,9 +4799,9 @@ class MeasurementReport(Template):
            Subject contexts
 
         """  # noqa: E501
-        root_item = self[0]
+        content_sequence = self[0].ContentSequence
         matches = [
-            (i + 1, item) for i, item in enumerate(root_item.ContentSequence)
+            (i + 1, item) for i, item in enumerate(content_sequence)
             if item.name == codes.DCM.SubjectClass
         ]
         subject_contexts = []
@@ -4312,21 +4817,29 @@ class MeasurementReport(Template):
             try:
                 next_index = matches[i + 1][0]
             except IndexError:
-                next_index = -1
+                next_index = len(content_sequence) - 1
             if item.value == codes.DCM.Specimen:
-                attributes = SubjectContextSpecimen.from_sequence(
-                    sequence=root_item.ContentSequence[index:next_index]
+                attributes = SubjectContextSpecimen.from_sequence_range(
+                    sequence=content_sequence,
+                    start=index,
+                    stop=next_index
                 )
             elif item.value == codes.DCM.Fetus:
-                attributes = SubjectContextFetus.from_sequence(
-                    sequence=root_item.ContentSequence[index:next_index]
+                attributes = SubjectContextFetus.from_sequence_range(
+                    sequence=content_sequence,
+                    start=index,
+                    stop=next_index
                 )
             elif item.value == codes.DCM.Device:
-                attributes = SubjectContextDevice.from_sequence(
-                    sequence=root_item.ContentSequence[index:next_index]
+                attributes = SubjectContextDevice.from_sequence_range(
+                    sequence=content_sequence,
+                    start=index,
+                    stop=next_index
                 )
             else:
-                raise ValueError('Unexpected subject class "{item.meaning}".')
+                raise ValueError(
+                    f'Unexpected subject class "{item.value.meaning}".'
+                )
             context = SubjectContext(
                 subject_class=item.value,
                 subject_class_specific_context=attributes
@@ -4379,6 +4892,69 @@ class MeasurementReport(Template):
         List[highdicom.sr.PlanarROIMeasurementsAndQualitativeEvaluations]
             Sequence of content items for each matched measurement group
 
+        """  # noqa: E501
+        return list(
+            self.iter_planar_roi_measurement_groups(
+                tracking_uid=tracking_uid,
+                finding_type=finding_type,
+                finding_site=finding_site,
+                reference_type=reference_type,
+                graphic_type=graphic_type,
+                referenced_sop_instance_uid=referenced_sop_instance_uid,
+                referenced_sop_class_uid=referenced_sop_class_uid
+            )
+        )
+
+    def iter_planar_roi_measurement_groups(
+        self,
+        tracking_uid: Optional[str] = None,
+        finding_type: Optional[Union[CodedConcept, Code]] = None,
+        finding_site: Optional[Union[CodedConcept, Code]] = None,
+        reference_type: Optional[Union[CodedConcept, Code]] = None,
+        graphic_type: Optional[
+            Union[GraphicTypeValues, GraphicTypeValues3D]
+        ] = None,
+        referenced_sop_instance_uid: Optional[str] = None,
+        referenced_sop_class_uid: Optional[str] = None
+    ) -> Iterator[PlanarROIMeasurementsAndQualitativeEvaluations]:
+        """Iterate over imaging measurement groups of planar ROIs.
+
+        Finds (and optionally filters) content items contained in the
+        CONTAINER content item "Measurement group" as specified by TID 1410
+        "Planar ROI Measurements and Qualitative Evaluations".
+
+        In contrast to :meth:`get_planar_roi_measurement_groups`, matched
+        measurement groups are yielded one at a time as the content tree is
+        traversed, which avoids materializing all groups when only a few
+        are needed.
+
+        Parameters
+        ----------
+        tracking_uid: Union[str, None], optional
+            Unique tracking identifier
+        finding_type: Union[highdicom.sr.CodedConcept, pydicom.sr.coding.Code, None], optional
+            Finding
+        finding_site: Union[highdicom.sr.CodedConcept, pydicom.sr.coding.Code, None], optional
+            Finding site
+        reference_type: Union[highdicom.sr.CodedConcept, pydicom.sr.coding.Code, None], optional
+            Type of referenced ROI. Valid values are limited to codes
+            `ImageRegion`, `ReferencedSegmentationFrame`, and `RegionInSpace`.
+        graphic_type: Union[highdicom.sr.GraphicTypeValues, highdicom.sr.GraphicTypeValues3D, None], optional
+            Graphic type of image region
+        referenced_sop_instance_uid: Union[str, None], optional
+            SOP Instance UID of the referenced instance, which may be a
+            segmentation image, source image for the region or segmentation, or
+            RT struct, depending on `reference_type`
+        referenced_sop_class_uid: Union[str, None], optional
+            SOP Class UID of the referenced instance, which may be a
+            segmentation image, source image for the region or segmentation, or
+            RT struct, depending on `reference_type`
+
+        Returns
+        -------
+        Iterator[highdicom.sr.PlanarROIMeasurementsAndQualitativeEvaluations]
+            Sequence of content items for each matched measurement group
+
         """  # noqa: E501
         if graphic_type is not None:
             if not isinstance(
@@ -4413,7 +4989,7 @@ class MeasurementReport(Template):
                 ):
                     raise TypeError(
                         'Supplying a referenced_sop_class_uid or '
-                        'referenced_sop_instance_uidis not valid'
+                        'referenced_sop_instance_uid is not valid '
                         'when graphic_type is an instance of '
                         'GraphicTypeValues3D, since SCOORD3D content items do '
                         'not contain references to specific source image '
@@ -4439,41 +5015,59 @@ class MeasurementReport(Template):
                         f'reference type "{reference_type.meaning}"'
                     )
 
-        measurement_group_items = self._find_measurement_groups()
-        sequences = []
-        for group_item in measurement_group_items:
-            if group_item.template_id is not None:
-                if group_item.template_id != '1410':
-                    continue
-            else:
+        return self._iter_planar_roi_measurement_groups(
+            tracking_uid=tracking_uid,
+            finding_type=finding_type,
+            finding_site=finding_site,
+            reference_type=reference_type,
+            graphic_type=graphic_type,
+            referenced_sop_instance_uid=referenced_sop_instance_uid,
+            referenced_sop_class_uid=referenced_sop_class_uid
+        )
+
+    def _iter_planar_roi_measurement_groups(
+        self,
+        tracking_uid: Optional[str] = None,
+        finding_type: Optional[Union[CodedConcept, Code]] = None,
+        finding_site: Optional[Union[CodedConcept, Code]] = None,
+        reference_type: Optional[Union[CodedConcept, Code]] = None,
+        graphic_type: Optional[
+            Union[GraphicTypeValues, GraphicTypeValues3D]
+        ] = None,
+        referenced_sop_instance_uid: Optional[str] = None,
+        referenced_sop_class_uid: Optional[str] = None
+    ) -> Iterator[PlanarROIMeasurementsAndQualitativeEvaluations]:
+        """Iterate over matching measurement groups without validating the
+        filter arguments (see :meth:`iter_planar_roi_measurement_groups`).
+        """
+        if finding_type is not None:
+            finding_type_key = _get_code_key(finding_type)
+        if finding_site is not None:
+            finding_site_key = _get_code_key(finding_site)
+        if reference_type is not None:
+            reference_type_key = _get_code_key(reference_type)
+        if graphic_type is not None:
+            # The graphic type filter only depends on the arguments, so
+            # resolve the expected attribute values up front
+            expected_value_type = _GRAPHIC_TYPE_VALUE_TYPES[type(graphic_type)]
+            expected_graphic_type = graphic_type.value
+        groups = self._iter_measurement_groups_by_template('1410')
+        for group_item, untagged in groups:
+            if untagged:
                 if not _contains_planar_rois(group_item):
                     continue
 
-            matches = []
+            group_index = _MeasurementGroupIndex(group_item)
+
             if finding_type is not None:
-                matches_finding = _contains_code_items(
-                    group_item,
-                    name=codes.DCM.Finding,
-                    value=finding_type,
-                    relationship_type=RelationshipTypeValues.CONTAINS
-                )
-                matches.append(matches_finding)
+                if finding_type_key not in group_index.findings:
+                    continue
             if finding_site is not None:
-                matches_finding_sites = _contains_code_items(
-                    group_item,
-                    name=codes.SCT.FindingSite,
-                    value=finding_site,
-                    relationship_type=RelationshipTypeValues.HAS_CONCEPT_MOD
-                )
-                matches.append(matches_finding_sites)
+                if finding_site_key not in group_index.finding_sites:
+                    continue
             if tracking_uid is not None:
-                matches_tracking_uid = _contains_uidref_items(
-                    group_item,
-                    name=codes.DCM.TrackingUniqueIdentifier,
-                    value=tracking_uid,
-                    relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
-                )
-                matches.append(matches_tracking_uid)
+                if tracking_uid not in group_index.tracking_uids:
+                    continue
 
             # Remaining checks all relate to the single content item that
             # describes the ROI reference
@@ -4485,27 +5079,20 @@ class MeasurementReport(Template):
             ):
                 # Find the content item representing the ROI reference
                 found_ref_type, ref_item = _get_planar_roi_reference_item(
-                    group_item
+                    group_item,
+                    index=group_index.items_by_name
                 )
-                ref_value_type = ValueTypeValues(ref_item.ValueType)
+                found_ref_key = _get_code_key(found_ref_type)
 
                 if reference_type is not None:
-                    matches.append(found_ref_type == reference_type)
+                    if found_ref_key != reference_type_key:
+                        continue
 
                 if graphic_type is not None:
-                    found_gt: Union[GraphicTypeValues, GraphicTypeValues3D]
-                    if isinstance(graphic_type, GraphicTypeValues):
-                        if ref_value_type == ValueTypeValues.SCOORD:
-                            found_gt = GraphicTypeValues(ref_item.GraphicType)
-                            matches.append(found_gt == graphic_type)
-                        else:
-                            matches.append(False)
-                    else:
-                        if ref_value_type == ValueTypeValues.SCOORD3D:
-                            found_gt = GraphicTypeValues3D(ref_item.GraphicType)
-                            matches.append(found_gt == graphic_type)
-                        else:
-                            matches.append(False)
+                    if ref_item.ValueType != expected_value_type:
+                        continue
+                    if ref_item.GraphicType != expected_graphic_type:
+                        continue
 
                 if (
                     (referenced_sop_instance_uid is not None) or
@@ -4515,10 +5102,7 @@ class MeasurementReport(Template):
 
                     # Check the references directly in the content item for
                     # IMAGE or COMPOSITE items
-                    if found_ref_type in [
-                        codes.DCM.ReferencedSegmentationFrame,
-                        _REGION_IN_SPACE
-                    ]:
+                    if found_ref_key in _PLANAR_DIRECT_REF_TYPES:
                         sop_seq = ref_item.ReferencedSOPSequence[0]
                         matches_instance_uid = (
                             referenced_sop_instance_uid is None or (
@@ -4535,42 +5119,40 @@ class MeasurementReport(Template):
                         if matches_class_uid and matches_instance_uid:
                             matches_uids = True
 
-                    if found_ref_type == codes.DCM.ImageRegion:
+                    if (
+                        not matches_uids and
+                        found_ref_key == _IMAGE_REGION_KEY
+                    ):
                         # If 2D image region, check items in its content
                         # sequence for source images
-                        if ref_item.value_type == ValueTypeValues.SCOORD:
-                            # (SCOORD3 will not contain direct UID
-                            # references)
-                            if _contains_image_items(
-                                ref_item,
-                                name=None,
-                                referenced_sop_class_uid=referenced_sop_class_uid,  # noqa: E501
-                                referenced_sop_instance_uid=referenced_sop_instance_uid,  # noqa: E501
-                                relationship_type=RelationshipTypeValues.SELECTED_FROM  # noqa: E501
-                            ):
-                                matches_uids = True
-
-                    if found_ref_type == codes.DCM.ReferencedSegmentationFrame:
+                        selected_from = _get_selected_from_references(
+                            [ref_item]
+                        )
+                        matches_uids = selected_from.contains(
+                            referenced_sop_class_uid,
+                            referenced_sop_instance_uid
+                        )
+
+                    if (
+                        not matches_uids and
+                        found_ref_key == _REFERENCED_SEGMENTATION_FRAME_KEY
+                    ):
                         # Check for IMAGE item of SourceImageForSegmentation at
                         # the top level
-                        if _contains_image_items(
-                            group_item,
-                            name=codes.DCM.SourceImageForSegmentation,
-                            referenced_sop_class_uid=referenced_sop_class_uid,
-                            referenced_sop_instance_uid=referenced_sop_instance_uid,  # noqa: E501
-                            relationship_type=RelationshipTypeValues.CONTAINS
-                        ):
-                            matches_uids = True
-
-                    matches.append(matches_uids)
+                        source_images = group_index.get_image_references(
+                            codes.DCM.SourceImageForSegmentation
+                        )
+                        matches_uids = source_images.contains(
+                            referenced_sop_class_uid,
+                            referenced_sop_instance_uid
+                        )
 
-            if len(matches) == 0 or all(matches):
-                seq = PlanarROIMeasurementsAndQualitativeEvaluations.from_sequence(  # noqa: E501
-                    [group_item]
-                )
-                sequences.append(seq)
+                    if not matches_uids:
+                        continue
 
-        return sequences
+            yield PlanarROIMeasurementsAndQualitativeEvaluations.from_sequence(
+                [group_item]
+            )
 
     def get_volumetric_roi_measurement_groups(
         self,
@@ -4616,6 +5198,68 @@ class MeasurementReport(Template):
         List[highdicom.sr.VolumetricROIMeasurementsAndQualitativeEvaluations]
             Sequence of content items for each matched measurement group
 
+        """  # noqa: E501
+        return list(
+            self.iter_volumetric_roi_measurement_groups(
+                tracking_uid=tracking_uid,
+                finding_type=finding_type,
+                finding_site=finding_site,
+                reference_type=reference_type,
+                graphic_type=graphic_type,
+                referenced_sop_instance_uid=referenced_sop_instance_uid,
+                referenced_sop_class_uid=referenced_sop_class_uid
+            )
+        )
+
+    def iter_volumetric_roi_measurement_groups(
+        self,
+        tracking_uid: Optional[str] = None,
+        finding_type: Optional[Union[CodedConcept, Code]] = None,
+        finding_site: Optional[Union[CodedConcept, Code]] = None,
+        reference_type: Optional[Union[CodedConcept, Code]] = None,
+        graphic_type: Optional[GraphicTypeValues3D] = None,
+        referenced_sop_instance_uid: Optional[str] = None,
+        referenced_sop_class_uid: Optional[str] = None
+    ) -> Iterator[VolumetricROIMeasurementsAndQualitativeEvaluations]:
+        """Iterate over imaging measurement groups of volumetric ROIs.
+
+        Finds (and optionally filters) content items contained in the
+        CONTAINER content item "Measurement group" as specified by TID 1411
+        "Volumetric ROI Measurements and Qualitative Evaluations".
+
+        In contrast to :meth:`get_volumetric_roi_measurement_groups`, matched
+        measurement groups are yielded one at a time as the content tree is
+        traversed, which avoids materializing all groups when only a few
+        are needed.
+
+        Parameters
+        ----------
+        tracking_uid: Union[str, None], optional
+            Unique tracking identifier
+        finding_type: Union[highdicom.sr.CodedConcept, pydicom.sr.coding.Code, None], optional
+            Finding
+        finding_site: Union[highdicom.sr.CodedConcept, pydicom.sr.coding.Code, None], optional
+            Finding site
+        reference_type: Union[highdicom.sr.CodedConcept, pydicom.sr.coding.Code, None], optional
+            Type of referenced ROI. Valid values are limited to codes
+            `ImageRegion`, `ReferencedSegment`, `VolumeSurface` and
+            `RegionInSpace`.
+        graphic_type: Union[highdicom.sr.GraphicTypeValues, highdicom.sr.GraphicTypeValues3D, None], optional
+            Graphic type of image region
+        referenced_sop_instance_uid: Union[str, None], optional
+            SOP Instance UID of the referenced instance, which may be a
+            segmentation image, source image for the region or segmentation, or
+            RT struct, depending on `reference_type`
+        referenced_sop_class_uid: Union[str, None], optional
+            SOP Class UID of the referenced instance, which may be a
+            segmentation image, source image for the region or segmentation, or
+            RT struct, depending on `reference_type`
+
+        Returns
+        -------
+        Iterator[highdicom.sr.VolumetricROIMeasurementsAndQualitativeEvaluations]
+            Sequence of content items for each matched measurement group
+
         """  # noqa: E501
         if graphic_type is not None:
             if not isinstance(
@@ -4649,7 +5293,7 @@ class MeasurementReport(Template):
                 ):
                     raise TypeError(
                         'Supplying a referenced_sop_class_uid or '
-                        'referenced_sop_instance_uidis not valid'
+                        'referenced_sop_instance_uid is not valid '
                         'when graphic_type is an instance of '
                         'GraphicTypeValues3D, since SCOORD3D content items do '
                         'not contain references to specific source image '
@@ -4669,11 +5313,7 @@ class MeasurementReport(Template):
 
             # Check for input options incompatible with this reference type
             if graphic_type is not None:
-                ref_types_with_graphics = [
-                    codes.DCM.ImageRegion,
-                    codes.DCM.VolumeSurface
-                ]
-                if reference_type not in ref_types_with_graphics:
+                if _get_code_key(reference_type) not in _GRAPHIC_REF_TYPES:
                     raise ValueError(
                         'Specifying a graphic type is invalid when using '
                         f'a reference type "{reference_type.meaning}"'
@@ -4695,41 +5335,57 @@ class MeasurementReport(Template):
                             'must be of type GraphicTypeValues3D.'
                         )
 
-        sequences = []
-        measurement_group_items = self._find_measurement_groups()
-        for group_item in measurement_group_items:
-            if group_item.template_id is not None:
-                if group_item.template_id != '1411':
-                    continue
-            else:
+        return self._iter_volumetric_roi_measurement_groups(
+            tracking_uid=tracking_uid,
+            finding_type=finding_type,
+            finding_site=finding_site,
+            reference_type=reference_type,
+            graphic_type=graphic_type,
+            referenced_sop_instance_uid=referenced_sop_instance_uid,
+            referenced_sop_class_uid=referenced_sop_class_uid
+        )
+
+    def _iter_volumetric_roi_measurement_groups(
+        self,
+        tracking_uid: Optional[str] = None,
+        finding_type: Optional[Union[CodedConcept, Code]] = None,
+        finding_site: Optional[Union[CodedConcept, Code]] = None,
+        reference_type: Optional[Union[CodedConcept, Code]] = None,
+        graphic_type: Optional[GraphicTypeValues3D] = None,
+        referenced_sop_instance_uid: Optional[str] = None,
+        referenced_sop_class_uid: Optional[str] = None
+    ) -> Iterator[VolumetricROIMeasurementsAndQualitativeEvaluations]:
+        """Iterate over matching measurement groups without validating the
+        filter arguments (see :meth:`iter_volumetric_roi_measurement_groups`).
+        """
+        if finding_type is not None:
+            finding_type_key = _get_code_key(finding_type)
+        if finding_site is not None:
+            finding_site_key = _get_code_key(finding_site)
+        if reference_type is not None:
+            reference_type_key = _get_code_key(reference_type)
+        if graphic_type is not None:
+            # The graphic type filter only depends on the arguments, so
+            # resolve the expected attribute values up front
+            expected_value_type = _GRAPHIC_TYPE_VALUE_TYPES[type(graphic_type)]
+            expected_graphic_type = graphic_type.value
+        groups = self._iter_measurement_groups_by_template('1411')
+        for group_item, untagged in groups:
+            if untagged:
                 if not _contains_volumetric_rois(group_item):
                     continue
 
-            matches = []
+            group_index = _MeasurementGroupIndex(group_item)
+
             if finding_type is not None:
-                matches_finding = _contains_code_items(
-                    group_item,
-                    name=codes.DCM.Finding,
-                    value=finding_type,
-                    relationship_type=RelationshipTypeValues.CONTAINS
-                )
-                matches.append(matches_finding)
+                if finding_type_key not in group_index.findings:
+                    continue
             if finding_site is not None:
-                matches_finding_sites = _contains_code_items(
-                    group_item,
-                    name=codes.SCT.FindingSite,
-                    value=finding_site,
-                    relationship_type=RelationshipTypeValues.HAS_CONCEPT_MOD
-                )
-                matches.append(matches_finding_sites)
+                if finding_site_key not in group_index.finding_sites:
+                    continue
             if tracking_uid is not None:
-                matches_tracking_uid = _contains_uidref_items(
-                    group_item,
-                    name=codes.DCM.TrackingUniqueIdentifier,
-                    value=tracking_uid,
-                    relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
-                )
-                matches.append(matches_tracking_uid)
+                if tracking_uid not in group_index.tracking_uids:
+                    continue
 
             # Remaining checks all relate to the content items that
             # describes the ROI reference
@@ -4741,31 +5397,20 @@ class MeasurementReport(Template):
             ):
                 # Find the contents item representing the ROI reference
                 found_ref_type, ref_items = _get_volumetric_roi_reference_items(
-                    group_item
+                    group_item,
+                    index=group_index.items_by_name
                 )
-                ref_value_type = ValueTypeValues(ref_items[0].ValueType)
+                found_ref_key = _get_code_key(found_ref_type)
 
                 if reference_type is not None:
-                    matches.append(found_ref_type == reference_type)
+                    if found_ref_key != reference_type_key:
+                        continue
 
                 if graphic_type is not None:
-                    found_gt: Union[GraphicTypeValues, GraphicTypeValues3D]
-                    if isinstance(graphic_type, GraphicTypeValues):
-                        if ref_value_type == ValueTypeValues.SCOORD:
-                            found_gt = GraphicTypeValues(
-                                ref_items[0].GraphicType
-                            )
-                            matches.append(found_gt == graphic_type)
-                        else:
-                            matches.append(False)
-                    else:
-                        if ref_value_type == ValueTypeValues.SCOORD3D:
-                            found_gt = GraphicTypeValues3D(
-                                ref_items[0].GraphicType
-                            )
-                            matches.append(found_gt == graphic_type)
-                        else:
-                            matches.append(False)
+                    if ref_items[0].ValueType != expected_value_type:
+                        continue
+                    if ref_items[0].GraphicType != expected_graphic_type:
+                        continue
 
                 if (
                     (referenced_sop_instance_uid is not None) or
@@ -4776,10 +5421,7 @@ class MeasurementReport(Template):
                     # Check the references directly in the content item for
                     # IMAGE or COMPOSITE items. In these cases there will be a
                     # single item
-                    if found_ref_type in [
-                        codes.DCM.ReferencedSegment,
-                        _REGION_IN_SPACE
-                    ]:
+                    if found_ref_key in _VOLUMETRIC_DIRECT_REF_TYPES:
                         sop_seq = ref_items[0].ReferencedSOPSequence[0]
                         matches_instance_uid = (
                             referenced_sop_instance_uid is None or (
@@ -4796,43 +5438,40 @@ class MeasurementReport(Template):
                         if matches_class_uid and matches_instance_uid:
                             matches_uids = True
 
-                    if found_ref_type == codes.DCM.ImageRegion:
-                        # If 2D image region, check items in its content
-                        # sequence for source images
-                        for ref_item in ref_items:
-                            if ref_item.value_type == ValueTypeValues.SCOORD:
-                                # (SCOORD3 will not contain direct UID
-                                # references)
-                                if _contains_image_items(
-                                    ref_item,
-                                    name=None,
-                                    referenced_sop_class_uid=referenced_sop_class_uid,  # noqa: E501
-                                    referenced_sop_instance_uid=referenced_sop_instance_uid,  # noqa: E501
-                                    relationship_type=RelationshipTypeValues.SELECTED_FROM  # noqa: E501
-                                ):
-                                    matches_uids = True
-
-                    if found_ref_type == codes.DCM.ReferencedSegment:
+                    if (
+                        not matches_uids and
+                        found_ref_key == _IMAGE_REGION_KEY
+                    ):
+                        # If 2D image region, check items in the content
+                        # sequences of all regions for source images
+                        selected_from = _get_selected_from_references(
+                            ref_items
+                        )
+                        matches_uids = selected_from.contains(
+                            referenced_sop_class_uid,
+                            referenced_sop_instance_uid
+                        )
+
+                    if (
+                        not matches_uids and
+                        found_ref_key == _REFERENCED_SEGMENT_KEY
+                    ):
                         # Check for IMAGE item of SourceImageForSegmentation at
                         # the top level
-                        if _contains_image_items(
-                            group_item,
-                            name=codes.DCM.SourceImageForSegmentation,
-                            referenced_sop_class_uid=referenced_sop_class_uid,
-                            referenced_sop_instance_uid=referenced_sop_instance_uid,  # noqa: E501
-                            relationship_type=RelationshipTypeValues.CONTAINS
-                        ):
-                            matches_uids = True
+                        source_images = group_index.get_image_references(
+                            codes.DCM.SourceImageForSegmentation
+                        )
+                        matches_uids = source_images.contains(
+                            referenced_sop_class_uid,
+                            referenced_sop_instance_uid
+                        )
 
-                    matches.append(matches_uids)
+                    if not matches_uids:
+                        continue
 
-            if len(matches) == 0 or all(matches):
-                seq = VolumetricROIMeasurementsAndQualitativeEvaluations.from_sequence(  # noqa: E501
-                    [group_item]
-                )
-                sequences.append(seq)
-
-        return sequences
+            yield VolumetricROIMeasurementsAndQualitativeEvaluations.from_sequence(  # noqa: E501
+                [group_item]
+            )
 
     def get_image_measurement_groups(
         self,
@@ -4867,67 +5506,91 @@ class MeasurementReport(Template):
             Sequence of content items for each matched measurement group
 
         """  # noqa: E501
-        measurement_group_items = self._find_measurement_groups()
-        sequences = []
-        for group_item in measurement_group_items:
-            if group_item.template_id is not None:
-                if group_item.template_id != '1501':
-                    continue
-            else:
-                contains_rois = _contains_planar_rois(group_item)
-                contains_rois |= _contains_volumetric_rois(group_item)
-                if contains_rois:
+        return list(
+            self.iter_image_measurement_groups(
+                tracking_uid=tracking_uid,
+                finding_type=finding_type,
+                finding_site=finding_site,
+                referenced_sop_instance_uid=referenced_sop_instance_uid,
+                referenced_sop_class_uid=referenced_sop_class_uid
+            )
+        )
+
+    def iter_image_measurement_groups(
+        self,
+        tracking_uid: Optional[str] = None,
+        finding_type: Optional[Union[CodedConcept, Code]] = None,
+        finding_site: Optional[Union[CodedConcept, Code]] = None,
+        referenced_sop_instance_uid: Optional[str] = None,
+        referenced_sop_class_uid: Optional[str] = None
+    ) -> Iterator[MeasurementsAndQualitativeEvaluations]:
+        """Iterate over imaging measurements of images.
+
+        Finds (and optionally filters) content items contained in the
+        CONTAINER content item "Measurement Group" as specified by TID 1501
+        "Measurement and Qualitative Evaluation Group".
+
+        In contrast to :meth:`get_image_measurement_groups`, matched
+        measurement groups are yielded one at a time as the content tree is
+        traversed, which avoids materializing all groups when only a few
+        are needed.
+
+        Parameters
+        ----------
+        tracking_uid: Union[str, None], optional
+            Unique tracking identifier
+        finding_type: Union[highdicom.sr.CodedConcept, pydicom.sr.coding.Code, None], optional
+            Finding
+        finding_site: Union[highdicom.sr.CodedConcept, pydicom.sr.coding.Code, None], optional
+            Finding site
+        referenced_sop_instance_uid: Union[str, None], optional
+            SOP Instance UID of the referenced instance.
+        referenced_sop_class_uid: Union[str, None], optional
+            SOP Class UID of the referenced instance.
+
+        Returns
+        -------
+        Iterator[highdicom.sr.MeasurementsAndQualitativeEvaluations]
+            Sequence of content items for each matched measurement group
+
+        """  # noqa: E501
+        if finding_type is not None:
+            finding_type_key = _get_code_key(finding_type)
+        if finding_site is not None:
+            finding_site_key = _get_code_key(finding_site)
+        groups = self._iter_measurement_groups_by_template('1501')
+        for group_item, untagged in groups:
+            if untagged:
+                if _classify_measurement_group(group_item) != 'image':
                     continue
 
-            matches = []
+            group_index = _MeasurementGroupIndex(group_item)
+
             if finding_type is not None:
-                matches_finding = _contains_code_items(
-                    group_item,
-                    name=codes.DCM.Finding,
-                    value=finding_type,
-                    relationship_type=RelationshipTypeValues.CONTAINS
-                )
-                matches.append(matches_finding)
+                if finding_type_key not in group_index.findings:
+                    continue
             if finding_site is not None:
-                matches_finding_sites = _contains_code_items(
-                    group_item,
-                    name=codes.SCT.FindingSite,
-                    value=finding_site,
-                    relationship_type=RelationshipTypeValues.HAS_CONCEPT_MOD
-                )
-                matches.append(matches_finding_sites)
+                if finding_site_key not in group_index.finding_sites:
+                    continue
             if tracking_uid is not None:
-                matches_tracking_uid = _contains_uidref_items(
-                    group_item,
-                    name=codes.DCM.TrackingUniqueIdentifier,
-                    value=tracking_uid,
-                    relationship_type=RelationshipTypeValues.HAS_OBS_CONTEXT
-                )
-                matches.append(matches_tracking_uid)
+                if tracking_uid not in group_index.tracking_uids:
+                    continue
 
             if (
                 (referenced_sop_instance_uid is not None) or
                 (referenced_sop_class_uid is not None)
             ):
-                matches_uids = _contains_image_items(
-                    group_item,
-                    name=_SOURCE,
-                    referenced_sop_class_uid=referenced_sop_class_uid,
-                    referenced_sop_instance_uid=referenced_sop_instance_uid,
-                    relationship_type=RelationshipTypeValues.CONTAINS
+                source_images = group_index.get_image_references(_SOURCE)
+                matches_uids = source_images.contains(
+                    referenced_sop_class_uid,
+                    referenced_sop_instance_uid
                 )
-                matches.append(matches_uids)
+                if not matches_uids:
+                    continue
 
-            seq = MeasurementsAndQualitativeEvaluations.from_sequence(
+            yield MeasurementsAndQualitativeEvaluations.from_sequence(
                 [group_item]
             )
-            if len(matches) == 0:
-                sequences.append(seq)
-            else:
-                if all(matches):
-                    sequences.append(seq)
-
-        return sequences
 
 
 class ImageLibraryEntry(Template):
@@ -4974,6 +5637,15 @@ class ImageLibrary(Template):
             Image Datasets to include in image library. Non-image
             objects will throw an exception.
 
+        Note
+        ----
+        Only the attributes listed in
+        :const:`highdicom.sr.IMAGE_LIBRARY_REQUIRED_TAGS` are accessed. When
+        reading the images from files solely for inclusion in the library,
+        it is sufficient (and considerably faster for large images) to read
+        these attributes only, e.g., via ``pydicom.dcmread(fp,
+        specific_tags=IMAGE_LIBRARY_REQUIRED_TAGS, stop_before_pixels=True)``.
+
         """
         super().__init__()
         library_item = ContainerContentItem(
@@ -4982,53 +5654,78 @@ class ImageLibrary(Template):
         )
         library_item.ContentSequence = ContentSequence()
         if datasets is not None:
-            groups = collections.defaultdict(list)
+            groups: Dict[
+                Tuple[Union[Code, str], ...],
+                List[ImageContentItem]
+            ] = {}
+            # Images of a library typically share only a few SOP classes
+            modality_cache: Dict[str, Code] = {}
             for ds in datasets:
-                modality = _get_coded_modality(ds.SOPClassUID)
-                image_item = ImageContentItem(
-                    name=CodedConcept(
-                        value='260753009',
-                        meaning='Source',
-                        scheme_designator='SCT'
-                    ),
-                    referenced_sop_instance_uid=ds.SOPInstanceUID,
-                    referenced_sop_class_uid=ds.SOPClassUID,
-                    relationship_type=RelationshipTypeValues.CONTAINS
-                )
-                descriptors = ImageLibraryEntryDescriptors(ds)
-
-                image_item.ContentSequence = ContentSequence()
-                image_item.ContentSequence.extend(descriptors)
-                if 'FrameOfReferenceUID' in ds:
-                    # Only type 1 attributes
-                    shared_descriptors = (
-                        modality,
-                        ds.FrameOfReferenceUID,
-                    )
+                try:
+                    modality = modality_cache[ds.SOPClassUID]
+                except KeyError:
+                    modality = _get_coded_modality(ds.SOPClassUID)
+                    modality_cache[ds.SOPClassUID] = modality
+                image_item = self._create_image_item(ds)
+
+                # Only type 1 attributes
+                frame_of_reference_uid = ds.get('FrameOfReferenceUID')
+                shared_descriptors: Tuple[Union[Code, str], ...]
+                if frame_of_reference_uid is not None:
+                    shared_descriptors = (modality, frame_of_reference_uid)
                 else:
-                    shared_descriptors = (
-                        modality,
-                    )
-                groups[shared_descriptors].append(image_item)
+                    shared_descriptors = (modality, )
+                groups.setdefault(shared_descriptors, []).append(image_item)
 
             for shared_descriptors, image_items in groups.items():
-                image = image_items[0]
                 group_item = ContainerContentItem(
                     name=codes.DCM.ImageLibraryGroup,
                     relationship_type=RelationshipTypeValues.CONTAINS
                 )
-                group_item.ContentSequence = ContentSequence()
-
-                if 'FrameOfReferenceUID' in image:
-                    group_item.ContentSequence.append(
+                group_content: List[ContentItem] = []
+                # The grouping key includes the Frame of Reference UID as
+                # second element if (and only if) the images have one
+                if len(shared_descriptors) == 2:
+                    group_content.append(
                         UIDRefContentItem(
                             name=codes.DCM.FrameOfReferenceUID,
                             value=shared_descriptors[1],
                             relationship_type=RelationshipTypeValues.HAS_ACQ_CONTEXT  # noqa: E501
                         )
                     )
-                group_item.ContentSequence.extend(image_items)
-            if len(group_item) > 0:
+                group_content.extend(image_items)
+                group_item.ContentSequence = ContentSequence(group_content)
                 library_item.ContentSequence.append(group_item)
 
         self.append(library_item)
+
+    @staticmethod
+    def _create_image_item(dataset: Dataset) -> ImageContentItem:
+        """Create the library entry for an image.
+
+        Parameters
+        ----------
+        dataset: pydicom.dataset.Dataset
+            Metadata of the image
+
+        Returns
+        -------
+        highdicom.sr.ImageContentItem
+            SR Content Item referencing the image, including its image
+            library entry descriptors
+
+        """
+        image_item = ImageContentItem(
+            name=CodedConcept(
+                value='260753009',
+                meaning='Source',
+                scheme_designator='SCT'
+            ),
+            referenced_sop_instance_uid=dataset.SOPInstanceUID,
+            referenced_sop_class_uid=dataset.SOPClassUID,
+            relationship_type=RelationshipTypeValues.CONTAINS
+        )
+        image_item.ContentSequence = ContentSequence(
+            ImageLibraryEntryDescriptors(dataset)
+        )
+        return image_item
@@ -510,7 +510,6 @@ class ContentSequence(DataElementSequence):
 
         """
         for item in val:
-            self._lut[item.name].append(item)
             self.append(item)
 
     def insert(   # type: ignore[override]
@@ -6,6 +6,12 @@ import warnings
 from pydicom.valuerep import PersonName
 
 
+_PERSON_NAME_URL = (
+    'https://dicom.nema.org/dicom/2013/output/chtml/part05/'
+    'sect_6.2.html#sect_6.2.1.2'
+)
+
+
 def check_person_name(person_name: Union[str, PersonName]) -> None:
     """Check value is valid for the value representation "person name".
 
@@ -43,19 +49,21 @@ def check_person_name(person_name: Union[str, PersonName]) -> None:
         If the provided person name has an invalid type.
 
     """
-    if not isinstance(person_name, (str, PersonName)):
+    if isinstance(person_name, PersonName):
+        # Both the "in" and "!=" operators of PersonName re-join the name
+        # components, so convert the name to a string only once
+        name = str(person_name)
+    elif isinstance(person_name, str):
+        name = person_name
+    else:
         raise TypeError('Invalid type for a person name.')
 
-    name_url = (
-        'https://dicom.nema.org/dicom/2013/output/chtml/part05/'
-        'sect_6.2.html#sect_6.2.1.2'
-    )
-    if '^' not in person_name and person_name != '':  # empty string is allowed
+    if name and '^' not in name:  # empty string is allowed
         warnings.warn(
-            f'The string "{person_name}" is unlikely to represent the '
+            f'The string "{name}" is unlikely to represent the '
             'intended person name since it contains only a single component. '
             'Construct a person name according to the format in described '
-            f'in {name_url}, or, in pydicom 2.2.0 or later, use the '
+            f'in {_PERSON_NAME_URL}, or, in pydicom 2.2.0 or later, use the '
             'pydicom.valuerep.PersonName.from_named_components() method '
             'to construct the person name correctly. If a single-component '
             'name is really intended, add a trailing caret character to '
@@ -44,6 +44,18 @@ from highdicom.sr.value_types import (
 from .utils import write_and_read_dataset
 
 
+# Concept names that are used throughout the specimen tests
+_SPECIMEN_IDENTIFIER = codes.DCM.SpecimenIdentifier
+_PROCESSING_TYPE = codes.DCM.ProcessingType
+_SPECIMEN_COLLECTION = codes.SCT.SpecimenCollection
+
+# Read-only LUT data shared by the LUT tests
+_LUT_DATA_U8 = np.arange(10, 100, dtype=np.uint8)
+_LUT_DATA_U8.setflags(write=False)
+_LUT_DATA_U16 = np.arange(510, 600, dtype=np.uint16)
+_LUT_DATA_U16.setflags(write=False)
+
+
 class TestContentCreatorIdentification(TestCase):
 
     def setUp(self):
@@ -70,11 +82,10 @@ class TestContentCreatorIdentification(TestCase):
         assert len(creator_id) == 1
         creator_id_item = creator_id[0]
         assert creator_id_item.InstitutionName == self._institution_name
-        for code1, code2 in zip(
-            creator_id_item.PersonIdentificationCodeSequence,
-            self._person_codes
-        ):
-            assert code1.CodeValue == code2.value
+        assert [
+            code.CodeValue
+            for code in creator_id_item.PersonIdentificationCodeSequence
+        ] == [code.value for code in self._person_codes]
 
     def test_construction_full(self):
         creator_id = ContentCreatorIdentificationCodeSequence(
@@ -91,11 +102,10 @@ class TestContentCreatorIdentification(TestCase):
         assert len(creator_id) == 1
         creator_id_item = creator_id[0]
         assert creator_id_item.InstitutionName == self._institution_name
-        for code1, code2 in zip(
-            creator_id_item.PersonIdentificationCodeSequence,
-            self._person_codes
-        ):
-            assert code1.CodeValue == code2.value
+        assert [
+            code.CodeValue
+            for code in creator_id_item.PersonIdentificationCodeSequence
+        ] == [code.value for code in self._person_codes]
         assert creator_id_item.PersonAddress == self._person_address
         assert (
             creator_id_item.PersonTelephoneNumbers ==
@@ -119,74 +129,65 @@ class TestContentCreatorIdentification(TestCase):
         assert (department_code.CodeValue == self._department_code.value)
 
 
-class TestLUT(TestCase):
+def _check_lut(lut, lut_data, first_mapped_value, lut_explanation=None):
+    assert lut.LUTDescriptor == [len(lut_data), first_mapped_value, 16]
+    assert lut.bits_per_entry == 16
+    assert lut.first_mapped_value == first_mapped_value
+    assert np.array_equal(lut.lut_data, lut_data)
+    if lut_explanation is None:
+        assert not hasattr(lut, 'LUTExplanation')
+    else:
+        assert lut.LUTExplanation == lut_explanation
 
-    def setUp(self):
-        super().setUp()
-        self._lut_data = np.arange(10, 100, dtype=np.uint8)
-        self._lut_data_16 = np.arange(510, 600, dtype=np.uint16)
-        self._explanation = 'My LUT'
+
+class TestLUT(TestCase):
 
     # Commented out until 8 bit LUTs are reimplemented
     # def test_construction(self):
     #     first_value = 0
     #     lut = LUT(
     #         first_mapped_value=first_value,
-    #         lut_data=self._lut_data,
+    #         lut_data=_LUT_DATA_U8,
     #     )
-    #     assert lut.LUTDescriptor == [len(self._lut_data), first_value, 8]
+    #     assert lut.LUTDescriptor == [len(_LUT_DATA_U8), first_value, 8]
     #     assert lut.bits_per_entry == 8
     #     assert lut.first_mapped_value == first_value
-    #     assert np.array_equal(lut.lut_data, self._lut_data)
+    #     assert np.array_equal(lut.lut_data, _LUT_DATA_U8)
     #     assert not hasattr(lut, 'LUTExplanation')
 
     def test_construction_16bit(self):
         first_value = 0
         lut = LUT(
             first_mapped_value=first_value,
-            lut_data=self._lut_data_16
+            lut_data=_LUT_DATA_U16
         )
-        assert lut.LUTDescriptor == [len(self._lut_data), first_value, 16]
-        assert lut.bits_per_entry == 16
-        assert lut.first_mapped_value == first_value
-        assert np.array_equal(lut.lut_data, self._lut_data_16)
-        assert not hasattr(lut, 'LUTExplanation')
+        _check_lut(lut, _LUT_DATA_U16, first_value)
 
     def test_construction_explanation(self):
         first_value = 0
         lut = LUT(
             first_mapped_value=first_value,
-            lut_data=self._lut_data_16,
-            lut_explanation=self._explanation
+            lut_data=_LUT_DATA_U16,
+            lut_explanation='My LUT'
         )
-        assert lut.LUTDescriptor == [len(self._lut_data), first_value, 16]
-        assert lut.bits_per_entry == 16
-        assert lut.first_mapped_value == first_value
-        assert np.array_equal(lut.lut_data, self._lut_data_16)
-        assert lut.LUTExplanation == self._explanation
+        _check_lut(lut, _LUT_DATA_U16, first_value, 'My LUT')
 
 
 class TestModalityLUT(TestCase):
 
-    def setUp(self):
-        super().setUp()
-        self._lut_data = np.arange(10, 100, dtype=np.uint8)
-        self._lut_data_16 = np.arange(510, 600, dtype=np.uint16)
-        self._explanation = 'My LUT'
-
     # Commented out until 8 bit LUTs are reimplemented
     # def test_construction(self):
     #     first_value = 0
     #     lut = ModalityLUT(
     #         lut_type=RescaleTypeValues.HU,
     #         first_mapped_value=first_value,
-    #         lut_data=self._lut_data,
+    #         lut_data=_LUT_DATA_U8,
     #     )
     #     assert lut.ModalityLUTType == RescaleTypeValues.HU.value
-    #     assert lut.LUTDescriptor == [len(self._lut_data), first_value, 8]
+    #     assert lut.LUTDescriptor == [len(_LUT_DATA_U8), first_value, 8]
     #     assert lut.bits_per_entry == 8
     #     assert lut.first_mapped_value == first_value
-    #     assert np.array_equal(lut.lut_data, self._lut_data)
+    #     assert np.array_equal(lut.lut_data, _LUT_DATA_U8)
     #     assert not hasattr(lut, 'LUTExplanation')
 
     def test_construction_16bit(self):
@@ -194,14 +195,10 @@ class TestModalityLUT(TestCase):
         lut = ModalityLUT(
             lut_type=RescaleTypeValues.HU,
             first_mapped_value=first_value,
-            lut_data=self._lut_data_16
+            lut_data=_LUT_DATA_U16
         )
         assert lut.ModalityLUTType == RescaleTypeValues.HU.value
-        assert lut.LUTDescriptor == [len(self._lut_data_16), first_value, 16]
-        assert lut.bits_per_entry == 16
-        assert lut.first_mapped_value == first_value
-        assert np.array_equal(lut.lut_data, self._lut_data_16)
-        assert not hasattr(lut, 'LUTExplanation')
+        _check_lut(lut, _LUT_DATA_U16, first_value)
 
     def test_construction_string_type(self):
         first_value = 0
@@ -209,25 +206,21 @@ class TestModalityLUT(TestCase):
         lut = ModalityLUT(
             lut_type=lut_type,
             first_mapped_value=first_value,
-            lut_data=self._lut_data_16
+            lut_data=_LUT_DATA_U16
         )
         assert lut.ModalityLUTType == lut_type
-        assert lut.LUTDescriptor == [len(self._lut_data_16), first_value, 16]
-        assert np.array_equal(lut.lut_data, self._lut_data_16)
-        assert not hasattr(lut, 'LUTExplanation')
+        _check_lut(lut, _LUT_DATA_U16, first_value)
 
     def test_construction_with_exp(self):
         first_value = 0
         lut = ModalityLUT(
             lut_type=RescaleTypeValues.HU,
             first_mapped_value=first_value,
-            lut_data=self._lut_data_16,
-            lut_explanation=self._explanation
+            lut_data=_LUT_DATA_U16,
+            lut_explanation='My LUT'
         )
         assert lut.ModalityLUTType == RescaleTypeValues.HU.value
-        assert lut.LUTDescriptor == [len(self._lut_data_16), first_value, 16]
-        assert np.array_equal(lut.lut_data, self._lut_data_16)
-        assert lut.LUTExplanation == self._explanation
+        _check_lut(lut, _LUT_DATA_U16, first_value, 'My LUT')
 
     def test_construction_empty_data(self):
         with pytest.raises(ValueError):
@@ -242,7 +235,7 @@ class TestModalityLUT(TestCase):
             ModalityLUT(
                 lut_type=RescaleTypeValues.HU,
                 first_mapped_value=-1,  # invalid
-                lut_data=self._lut_data_16,
+                lut_data=_LUT_DATA_U16,
             )
 
     def test_construction_wrong_dtype(self):
@@ -282,9 +275,7 @@ class TestPlanePositionSequence(TestCase):
         )
         assert len(seq) == 1
         item = seq[0]
-        assert item.ImagePositionPatient[0] == image_position[0]
-        assert item.ImagePositionPatient[1] == image_position[1]
-        assert item.ImagePositionPatient[2] == image_position[2]
+        assert list(item.ImagePositionPatient) == image_position
 
 
 class TestPlaneOrientationSequence(TestCase):
@@ -298,12 +289,7 @@ class TestPlaneOrientationSequence(TestCase):
         )
         assert len(seq) == 1
         item = seq[0]
-        assert item.ImageOrientationSlide[0] == image_orientation[0]
-        assert item.ImageOrientationSlide[1] == image_orientation[1]
-        assert item.ImageOrientationSlide[2] == image_orientation[2]
-        assert item.ImageOrientationSlide[3] == image_orientation[3]
-        assert item.ImageOrientationSlide[4] == image_orientation[4]
-        assert item.ImageOrientationSlide[5] == image_orientation[5]
+        assert list(item.ImageOrientationSlide) == image_orientation
 
     def test_construction_patient(self):
         coordinate_system = 'PATIENT'
@@ -314,12 +300,7 @@ class TestPlaneOrientationSequence(TestCase):
         )
         assert len(seq) == 1
         item = seq[0]
-        assert item.ImageOrientationPatient[0] == image_orientation[0]
-        assert item.ImageOrientationPatient[1] == image_orientation[1]
-        assert item.ImageOrientationPatient[2] == image_orientation[2]
-        assert item.ImageOrientationPatient[3] == image_orientation[3]
-        assert item.ImageOrientationPatient[4] == image_orientation[4]
-        assert item.ImageOrientationPatient[5] == image_orientation[5]
+        assert list(item.ImageOrientationPatient) == image_orientation
 
 
 class TestPixelMeasuresSequence(TestCase):
@@ -362,7 +343,7 @@ class TestSpecimenCollection(TestCase):
         assert not seq.is_root
         assert not seq.is_sr
         item = seq[0]
-        assert item.name == codes.SCT.SpecimenCollection
+        assert item.name == _SPECIMEN_COLLECTION
         assert item.value == procedure
         assert item.relationship_type is None
 
@@ -381,18 +362,14 @@ class TestSpecimenSampling(TestCase):
         assert len(seq) == 3
         assert not seq.is_root
         assert not seq.is_sr
-        method_item = seq[0]
-        assert method_item.name == codes.DCM.SamplingMethod
-        assert method_item.value == method
-        assert method_item.relationship_type is None
-        parent_id_item = seq[1]
-        assert parent_id_item.name == codes.DCM.ParentSpecimenIdentifier
-        assert parent_id_item.value == parent_id
-        assert parent_id_item.relationship_type is None
-        parent_type_item = seq[2]
-        assert parent_type_item.name == codes.DCM.ParentSpecimenType
-        assert parent_type_item.value == parent_type
-        assert parent_type_item.relationship_type is None
+        expected = [
+            (codes.DCM.SamplingMethod, method, None),
+            (codes.DCM.ParentSpecimenIdentifier, parent_id, None),
+            (codes.DCM.ParentSpecimenType, parent_type, None),
+        ]
+        assert [
+            (item.name, item.value, item.relationship_type) for item in seq
+        ] == expected
 
 
 class TestSpecimenStaining(TestCase):
@@ -406,14 +383,13 @@ class TestSpecimenStaining(TestCase):
         assert len(seq) == 2
         assert not seq.is_root
         assert not seq.is_sr
-        hematoxylin_item = seq[0]
-        assert hematoxylin_item.name == codes.SCT.UsingSubstance
-        assert hematoxylin_item.value == substances[0]
-        assert hematoxylin_item.relationship_type is None
-        eosin_item = seq[1]
-        assert eosin_item.name == codes.SCT.UsingSubstance
-        assert eosin_item.value == substances[1]
-        assert eosin_item.relationship_type is None
+        expected = [
+            (codes.SCT.UsingSubstance, substance, None)
+            for substance in substances
+        ]
+        assert [
+            (item.name, item.value, item.relationship_type) for item in seq
+        ] == expected
 
     def test_construction_missing_substances(self):
         with pytest.raises(ValueError):
@@ -423,7 +399,7 @@ class TestSpecimenStaining(TestCase):
 class TestSpecimenPreparationStep(TestCase):
     def test_construction_collection(self):
         specimen_id = 'specimen id'
-        processing_type = codes.SCT.SpecimenCollection
+        processing_type = _SPECIMEN_COLLECTION
         procedure = codes.SCT.Excision
         instance = SpecimenPreparationStep(
             specimen_id=specimen_id,
@@ -434,43 +410,40 @@ class TestSpecimenPreparationStep(TestCase):
         assert not seq.is_root
         assert not seq.is_sr
         assert instance.specimen_id == specimen_id
-        specimen_id_item = seq[0]
-        assert specimen_id_item.name == codes.DCM.SpecimenIdentifier
-        assert specimen_id_item.value == specimen_id
-        assert specimen_id_item.relationship_type is None
-
         assert instance.processing_type == processing_type
-        processing_type_item = seq[1]
-        assert processing_type_item.name == codes.DCM.ProcessingType
-        assert processing_type_item.value == processing_type
-        assert processing_type_item.relationship_type is None
-
         assert isinstance(instance.processing_procedure, SpecimenCollection)
-        procedure_item = seq[2]
-        assert procedure_item.name == codes.SCT.SpecimenCollection
-        assert procedure_item.value == procedure
-        assert procedure_item.relationship_type is None
+        expected = [
+            (_SPECIMEN_IDENTIFIER, specimen_id, None),
+            (_PROCESSING_TYPE, processing_type, None),
+            (_SPECIMEN_COLLECTION, procedure, None),
+        ]
+        assert [
+            (item.name, item.value, item.relationship_type) for item in seq
+        ] == expected
 
     def test_construction_collection_from_dataset(self):
         specimen_id = 'specimen id'
-        processing_type = codes.SCT.SpecimenCollection
+        processing_type = _SPECIMEN_COLLECTION
         procedure = codes.SCT.Excision
         dataset = Dataset()
         dataset.SpecimenPreparationStepContentItemSequence = [
             TextContentItem(
-                name=codes.DCM.SpecimenIdentifier,
+                name=_SPECIMEN_IDENTIFIER,
                 value=specimen_id
             ),
             CodeContentItem(
-                name=codes.DCM.ProcessingType,
+                name=_PROCESSING_TYPE,
                 value=processing_type
             ),
             CodeContentItem(
-                name=codes.SCT.SpecimenCollection,
+                name=_SPECIMEN_COLLECTION,
                 value=procedure
             )
         ]
-        dataset_reread = write_and_read_dataset(dataset)
+        dataset_reread = write_and_read_dataset(
+            dataset,
+            specific_tags=['SpecimenPreparationStepContentItemSequence']
+        )
         instance = SpecimenPreparationStep.from_dataset(dataset_reread)
         assert isinstance(instance, SpecimenPreparationStep)
         assert len(instance.SpecimenPreparationStepContentItemSequence) == 3
@@ -483,6 +456,21 @@ class TestSpecimenPreparationStep(TestCase):
         assert isinstance(processing_procedure, SpecimenCollection)
         assert processing_procedure.procedure == procedure
 
+    def test_construction_unknown_processing_type_from_dataset(self):
+        dataset = Dataset()
+        dataset.SpecimenPreparationStepContentItemSequence = [
+            TextContentItem(
+                name=_SPECIMEN_IDENTIFIER,
+                value='specimen id'
+            ),
+            CodeContentItem(
+                name=_PROCESSING_TYPE,
+                value=codes.SCT.Biopsy
+            ),
+        ]
+        with pytest.raises(ValueError):
+            SpecimenPreparationStep.from_dataset(dataset)
+
     def test_construction_sampling(self):
         specimen_id = 'specimen id'
         processing_type = codes.SCT.SamplingOfTissueSpecimen
@@ -512,40 +500,18 @@ class TestSpecimenPreparationStep(TestCase):
         assert instance.embedding_medium == embedding_medium
         assert isinstance(instance.processing_procedure, SpecimenSampling)
 
-        specimen_id_item = seq[0]
-        assert specimen_id_item.name == codes.DCM.SpecimenIdentifier
-        assert specimen_id_item.value == specimen_id
-        assert specimen_id_item.relationship_type is None
-
-        processing_type_item = seq[1]
-        assert processing_type_item.name == codes.DCM.ProcessingType
-        assert processing_type_item.value == processing_type
-        assert processing_type_item.relationship_type is None
-
-        method_item = seq[2]
-        assert method_item.name == codes.DCM.SamplingMethod
-        assert method_item.value == method
-        assert method_item.relationship_type is None
-
-        parent_specimen_id_item = seq[3]
-        assert parent_specimen_id_item.name == codes.DCM.ParentSpecimenIdentifier  # noqa: E501
-        assert parent_specimen_id_item.value == parent_specimen_id
-        assert parent_specimen_id_item.relationship_type is None
-
-        parent_specimen_type_item = seq[4]
-        assert parent_specimen_type_item.name == codes.DCM.ParentSpecimenType
-        assert parent_specimen_type_item.value == parent_specimen_type
-        assert parent_specimen_type_item.relationship_type is None
-
-        fixative_item = seq[5]
-        assert fixative_item.name == codes.SCT.TissueFixative
-        assert fixative_item.value == fixative
-        assert fixative_item.relationship_type is None
-
-        embedding_medium_item = seq[6]
-        assert embedding_medium_item.name == codes.SCT.TissueEmbeddingMedium
-        assert embedding_medium_item.value == embedding_medium
-        assert embedding_medium_item.relationship_type is None
+        expected = [
+            (_SPECIMEN_IDENTIFIER, specimen_id, None),
+            (_PROCESSING_TYPE, processing_type, None),
+            (codes.DCM.SamplingMethod, method, None),
+            (codes.DCM.ParentSpecimenIdentifier, parent_specimen_id, None),
+            (codes.DCM.ParentSpecimenType, parent_specimen_type, None),
+            (codes.SCT.TissueFixative, fixative, None),
+            (codes.SCT.TissueEmbeddingMedium, embedding_medium, None),
+        ]
+        assert [
+            (item.name, item.value, item.relationship_type) for item in seq
+        ] == expected
 
     def test_construction_sampling_from_dataset(self):
         specimen_id = 'specimen id'
@@ -558,11 +524,11 @@ class TestSpecimenPreparationStep(TestCase):
         dataset = Dataset()
         dataset.SpecimenPreparationStepContentItemSequence = [
             TextContentItem(
-                name=codes.DCM.SpecimenIdentifier,
+                name=_SPECIMEN_IDENTIFIER,
                 value=specimen_id
             ),
             CodeContentItem(
-                name=codes.DCM.ProcessingType,
+                name=_PROCESSING_TYPE,
                 value=processing_type
             ),
             CodeContentItem(
@@ -586,7 +552,10 @@ class TestSpecimenPreparationStep(TestCase):
                 value=embedding_medium
             )
         ]
-        dataset_reread = write_and_read_dataset(dataset)
+        dataset_reread = write_and_read_dataset(
+            dataset,
+            specific_tags=['SpecimenPreparationStepContentItemSequence']
+        )
         instance = SpecimenPreparationStep.from_dataset(dataset_reread)
         assert isinstance(instance, SpecimenPreparationStep)
         assert instance.specimen_id == specimen_id
@@ -618,12 +587,12 @@ class TestSpecimenPreparationStep(TestCase):
         assert instance.embedding_medium is None
 
         specimen_id_item = seq[0]
-        assert specimen_id_item.name == codes.DCM.SpecimenIdentifier
+        assert specimen_id_item.name == _SPECIMEN_IDENTIFIER
         assert specimen_id_item.value == specimen_id
         assert specimen_id_item.relationship_type is None
 
         processing_type_item = seq[1]
-        assert processing_type_item.name == codes.DCM.ProcessingType
+        assert processing_type_item.name == _PROCESSING_TYPE
         assert processing_type_item.value == processing_type
         assert processing_type_item.relationship_type is None
 
@@ -639,11 +608,11 @@ class TestSpecimenPreparationStep(TestCase):
         dataset = Dataset()
         dataset.SpecimenPreparationStepContentItemSequence = [
             TextContentItem(
-                name=codes.DCM.SpecimenIdentifier,
+                name=_SPECIMEN_IDENTIFIER,
                 value=specimen_id
             ),
             CodeContentItem(
-                name=codes.DCM.ProcessingType,
+                name=_PROCESSING_TYPE,
                 value=processing_type
             ),
             CodeContentItem(
@@ -651,7 +620,10 @@ class TestSpecimenPreparationStep(TestCase):
                 value=substance
             ),
         ]
-        dataset_reread = write_and_read_dataset(dataset)
+        dataset_reread = write_and_read_dataset(
+            dataset,
+            specific_tags=['SpecimenPreparationStepContentItemSequence']
+        )
         instance = SpecimenPreparationStep.from_dataset(dataset_reread)
         assert isinstance(instance, SpecimenPreparationStep)
         assert instance.specimen_id == specimen_id
@@ -683,12 +655,12 @@ class TestSpecimenPreparationStep(TestCase):
         assert instance.embedding_medium is None
 
         specimen_id_item = seq[0]
-        assert specimen_id_item.name == codes.DCM.SpecimenIdentifier
+        assert specimen_id_item.name == _SPECIMEN_IDENTIFIER
         assert specimen_id_item.value == specimen_id
         assert specimen_id_item.relationship_type is None
 
         processing_type_item = seq[1]
-        assert processing_type_item.name == codes.DCM.ProcessingType
+        assert processing_type_item.name == _PROCESSING_TYPE
         assert processing_type_item.value == processing_type
         assert processing_type_item.relationship_type is None
 
@@ -702,7 +674,7 @@ class TestSpecimenPreparationStep(TestCase):
 
     def test_construction_processing_optionals(self):
         specimen_id = 'specimen id'
-        processing_type = codes.SCT.SpecimenCollection
+        processing_type = _SPECIMEN_COLLECTION
         procedure = codes.SCT.Excision
         processing_procedure = SpecimenCollection(procedure=procedure)
         processing_datetime = datetime.datetime(2023, 6, 17, 21, 38, 14)
@@ -737,7 +709,7 @@ class TestSpecimenPreparationStep(TestCase):
         assert len(seq) == 10
 
         specimen_id_item = seq[0]
-        assert specimen_id_item.name == codes.DCM.SpecimenIdentifier
+        assert specimen_id_item.name == _SPECIMEN_IDENTIFIER
         assert specimen_id_item.value == specimen_id
         assert specimen_id_item.relationship_type is None
 
@@ -754,7 +726,7 @@ class TestSpecimenPreparationStep(TestCase):
 
         processing_type_item = seq[2]
         assert (
-            processing_type_item.name == codes.DCM.ProcessingType
+            processing_type_item.name == _PROCESSING_TYPE
         )
         assert processing_type_item.value == processing_type
         assert processing_type_item.relationship_type is None
@@ -776,7 +748,7 @@ class TestSpecimenPreparationStep(TestCase):
 
         collection_step_item = seq[5]
         assert (
-            collection_step_item.name == codes.SCT.SpecimenCollection
+            collection_step_item.name == _SPECIMEN_COLLECTION
         )
         assert collection_step_item.value == procedure
         assert collection_step_item.relationship_type is None
@@ -808,11 +780,11 @@ class TestSpecimenPreparationStep(TestCase):
         dataset = Dataset()
         dataset.SpecimenPreparationStepContentItemSequence = [
             TextContentItem(
-                name=codes.DCM.SpecimenIdentifier,
+                name=_SPECIMEN_IDENTIFIER,
                 value=specimen_id
             ),
             CodeContentItem(
-                name=codes.DCM.ProcessingType,
+                name=_PROCESSING_TYPE,
                 value=processing_type
             ),
             CodeContentItem(
@@ -820,7 +792,10 @@ class TestSpecimenPreparationStep(TestCase):
                 value=description
             ),
         ]
-        dataset_reread = write_and_read_dataset(dataset)
+        dataset_reread = write_and_read_dataset(
+            dataset,
+            specific_tags=['SpecimenPreparationStepContentItemSequence']
+        )
         instance = SpecimenPreparationStep.from_dataset(dataset_reread)
         assert isinstance(instance, SpecimenPreparationStep)
         assert instance.specimen_id == specimen_id
@@ -833,7 +808,7 @@ class TestSpecimenPreparationStep(TestCase):
 
     def test_construction_processing_from_dataset_optionals(self):
         specimen_id = 'specimen id'
-        processing_type = codes.SCT.SpecimenCollection
+        processing_type = _SPECIMEN_COLLECTION
         procedure = codes.SCT.Excision
         processing_procedure = SpecimenCollection(procedure=procedure)
         processing_description = "processing description"
@@ -854,7 +829,7 @@ class TestSpecimenPreparationStep(TestCase):
         dataset = Dataset()
         dataset.SpecimenPreparationStepContentItemSequence = [
             TextContentItem(
-                name=codes.DCM.SpecimenIdentifier,
+                name=_SPECIMEN_IDENTIFIER,
                 value=specimen_id
             ),
             TextContentItem(
@@ -866,7 +841,7 @@ class TestSpecimenPreparationStep(TestCase):
                 value=processing_datetime
             ),
             CodeContentItem(
-                name=codes.DCM.ProcessingType,
+                name=_PROCESSING_TYPE,
                 value=processing_type
             ),
             TextContentItem(
@@ -874,7 +849,7 @@ class TestSpecimenPreparationStep(TestCase):
                 value=processing_description
             ),
             CodeContentItem(
-                name=codes.SCT.SpecimenCollection,
+                name=_SPECIMEN_COLLECTION,
                 value=procedure
             ),
             CodeContentItem(
@@ -894,7 +869,10 @@ class TestSpecimenPreparationStep(TestCase):
                 value=specimen_type
             )
         ]
-        dataset_reread = write_and_read_dataset(dataset)
+        dataset_reread = write_and_read_dataset(
+            dataset,
+            specific_tags=['SpecimenPreparationStepContentItemSequence']
+        )
         instance = SpecimenPreparationStep.from_dataset(dataset_reread)
         assert isinstance(instance, SpecimenPreparationStep)
         assert instance.specimen_id == specimen_id
@@ -1024,14 +1002,16 @@ class TestVOILUTTransformation(TestCase):
 
 class TestReferencedImageSequence(TestCase):
 
-    def setUp(self):
-        super().setUp()
-        self._ct_series = [
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The datasets are never modified, so they are only read once
+        cls._ct_series = [
             dcmread(f)
             for f in get_testdata_files('dicomdirtests/77654033/CT2/*')
         ]
-        self._ct_multiframe = dcmread(get_testdata_file('eCT_Supplemental.dcm'))
-        self._seg = dcmread(
+        cls._ct_multiframe = dcmread(get_testdata_file('eCT_Supplemental.dcm'))
+        cls._seg = dcmread(
             'data/test_files/seg_image_ct_binary_overlap.dcm'
         )
 
@@ -1186,6 +1166,16 @@ class TestPaletteColorLUT(TestCase):
         assert lut.lut_data.dtype == np.uint16
         np.array_equal(lut.lut_data, lut_data)
 
+    def test_lut_data_descriptor_mismatch(self):
+        lut_data = np.arange(10, 120, dtype=np.uint16)
+        lut = PaletteColorLUT(32, lut_data, color='red')
+        retrieved = lut.lut_data
+        assert retrieved.flags.writeable
+
+        lut.RedPaletteColorLookupTableDescriptor = [50, 0, 16]
+        with pytest.raises(RuntimeError):
+            lut.lut_data
+
     # Commented out until 8 bit LUTs are reimplemented
     # def test_construction_8bit(self):
     #     lut_data = np.arange(0, 256, dtype=np.uint8)
@@ -1210,21 +1200,30 @@ class TestPaletteColorLUT(TestCase):
     #     np.array_equal(lut.lut_data, lut_data)
 
 
+def _make_rgb_luts(first_mapped_value):
+    lut_data = [
+        np.arange(10, 120, dtype=np.uint16),
+        np.arange(20, 130, dtype=np.uint16),
+        np.arange(30, 140, dtype=np.uint16),
+    ]
+    luts = [
+        PaletteColorLUT(first_mapped_value, data, color=color)
+        for data, color in zip(lut_data, ['red', 'green', 'blue'])
+    ]
+    return lut_data, luts
+
+
 class TestPaletteColorLUTTransformation(TestCase):
 
     def setUp(self):
         super().setUp()
 
     def test_construction(self):
-        dtype = np.uint16
-        r_lut_data = np.arange(10, 120, dtype=dtype)
-        g_lut_data = np.arange(20, 130, dtype=dtype)
-        b_lut_data = np.arange(30, 140, dtype=dtype)
         first_mapped_value = 32
         lut_uid = UID()
-        r_lut = PaletteColorLUT(first_mapped_value, r_lut_data, color='red')
-        g_lut = PaletteColorLUT(first_mapped_value, g_lut_data, color='green')
-        b_lut = PaletteColorLUT(first_mapped_value, b_lut_data, color='blue')
+        lut_data, luts = _make_rgb_luts(first_mapped_value)
+        r_lut_data, g_lut_data, b_lut_data = lut_data
+        r_lut, g_lut, b_lut = luts
         instance = PaletteColorLUTTransformation(
             red_lut=r_lut,
             green_lut=g_lut,
@@ -1233,25 +1232,19 @@ class TestPaletteColorLUTTransformation(TestCase):
         )
         assert instance.PaletteColorLookupTableUID == lut_uid
         red_desc = [len(r_lut_data), first_mapped_value, 16]
-        r_lut_data_retrieved = np.frombuffer(
-            instance.RedPaletteColorLookupTableData,
-            dtype=np.uint16
+        assert (
+            instance.RedPaletteColorLookupTableData == r_lut_data.tobytes()
         )
-        assert np.array_equal(r_lut_data, r_lut_data_retrieved)
         assert instance.RedPaletteColorLookupTableDescriptor == red_desc
         green_desc = [len(g_lut_data), first_mapped_value, 16]
-        g_lut_data_retrieved = np.frombuffer(
-            instance.GreenPaletteColorLookupTableData,
-            dtype=np.uint16
+        assert (
+            instance.GreenPaletteColorLookupTableData == g_lut_data.tobytes()
         )
-        assert np.array_equal(g_lut_data, g_lut_data_retrieved)
         assert instance.GreenPaletteColorLookupTableDescriptor == green_desc
         blue_desc = [len(b_lut_data), first_mapped_value, 16]
-        b_lut_data_retrieved = np.frombuffer(
-            instance.BluePaletteColorLookupTableData,
-            dtype=np.uint16
+        assert (
+            instance.BluePaletteColorLookupTableData == b_lut_data.tobytes()
         )
-        assert np.array_equal(b_lut_data, b_lut_data_retrieved)
         assert instance.BluePaletteColorLookupTableDescriptor == blue_desc
 
         assert np.array_equal(instance.red_lut.lut_data, r_lut_data)
@@ -1259,13 +1252,7 @@ class TestPaletteColorLUTTransformation(TestCase):
         assert np.array_equal(instance.blue_lut.lut_data, b_lut_data)
 
     def test_construction_no_uid(self):
-        r_lut_data = np.arange(10, 120, dtype=np.uint16)
-        g_lut_data = np.arange(20, 130, dtype=np.uint16)
-        b_lut_data = np.arange(30, 140, dtype=np.uint16)
-        first_mapped_value = 32
-        r_lut = PaletteColorLUT(first_mapped_value, r_lut_data, color='red')
-        g_lut = PaletteColorLUT(first_mapped_value, g_lut_data, color='green')
-        b_lut = PaletteColorLUT(first_mapped_value, b_lut_data, color='blue')
+        _, (r_lut, g_lut, b_lut) = _make_rgb_luts(first_mapped_value=32)
         instance = PaletteColorLUTTransformation(
             red_lut=r_lut,
             green_lut=g_lut,
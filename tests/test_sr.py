@@ -18,6 +18,7 @@ from pydicom.uid import SegmentationStorage
 
 from highdicom.sr import CodedConcept
 from highdicom.sr import (
+    IMAGE_LIBRARY_REQUIRED_TAGS,
     AlgorithmIdentification,
     CodeContentItem,
     CompositeContentItem,
@@ -595,6 +596,11 @@ class TestCodedConcept(unittest.TestCase):
         c2 = CodedConcept(self._value, self._scheme_designator, self._meaning)
         assert c1 == c2
 
+    def test_equal_self(self):
+        c1 = CodedConcept(self._value, self._scheme_designator, self._meaning)
+        assert c1 == c1
+        assert not (c1 != c1)
+
     def test_not_equal(self):
         c1 = CodedConcept(self._value, self._scheme_designator, self._meaning)
         c2 = CodedConcept('373099004', 'SCT', 'Median Value of population')
@@ -1273,6 +1279,7 @@ class TestContentSequence(unittest.TestCase):
     def test_extend(self):
         seq = ContentSequence()
         seq.extend([self._item])
+        assert len(seq.find(self._item.name)) == 1
 
     def test_insert(self):
         seq = ContentSequence()
@@ -1498,6 +1505,21 @@ class TestPersonObserverIdentifyingAttributes(unittest.TestCase):
                 name=self._invalid_name
             )
 
+    def test_from_sequence_range(self):
+        seq = PersonObserverIdentifyingAttributes(
+            name=self._person_name,
+            login_name=self._login_name,
+            organization_name=self._organization_name,
+        )
+        attrs = PersonObserverIdentifyingAttributes.from_sequence_range(
+            seq,
+            start=0,
+            stop=2
+        )
+        assert attrs.name == self._person_name
+        assert attrs.login_name == self._login_name
+        assert attrs.organization_name is None
+
 
 class TestFindingSiteOptional(unittest.TestCase):
 
@@ -3367,6 +3389,12 @@ class TestMeasurementReport(unittest.TestCase):
         )
         assert len(matches) == 0
 
+        # Codes of the deprecated SRT coding scheme match their SCT equivalent
+        matches = measurement_report.get_image_measurement_groups(
+            finding_site=Code('T-28000', 'SRT', 'Lung')
+        )
+        assert len(matches) == 1
+
         matches = measurement_report.get_image_measurement_groups(
             tracking_uid=self._tracking_identifier[1].value
         )
@@ -3405,6 +3433,31 @@ class TestMeasurementReport(unittest.TestCase):
         )
         assert len(matches) == 0
 
+        groups = measurement_report.iter_image_measurement_groups(
+            finding_type=self._finding_type
+        )
+        group = next(groups)
+        assert isinstance(group, MeasurementsAndQualitativeEvaluations)
+        with pytest.raises(StopIteration):
+            next(groups)
+
+    def test_get_image_groups_without_template_id(self):
+        measurement_report = MeasurementReport(
+            observation_context=self._observation_context,
+            procedure_reported=self._procedure_reported,
+            imaging_measurements=[self._image_group, self._roi_group]
+        )
+        container_item = measurement_report[0].ContentSequence[-1]
+        for group_item in container_item.ContentSequence:
+            del group_item.ContentTemplateSequence
+
+        # The kind of each group is determined from its ROI content items
+        matches = measurement_report.get_image_measurement_groups()
+        assert len(matches) == 1
+        assert matches[0].tracking_uid == self._tracking_identifier[1].value
+        matches = measurement_report.get_planar_roi_measurement_groups()
+        assert len(matches) == 1
+
     def test_construction_planar(self):
         measurement_report = MeasurementReport(
             observation_context=self._observation_context,
@@ -3563,6 +3616,17 @@ class TestMeasurementReport(unittest.TestCase):
         )
         assert len(matches) == 0
 
+        groups = measurement_report.iter_volumetric_roi_measurement_groups(
+            finding_type=self._finding_type
+        )
+        group = next(groups)
+        assert isinstance(
+            group,
+            VolumetricROIMeasurementsAndQualitativeEvaluations
+        )
+        with pytest.raises(StopIteration):
+            next(groups)
+
     def test_from_sequence(self):
         measurement_report = MeasurementReport(
             observation_context=self._observation_context,
@@ -4621,6 +4685,52 @@ class TestGetPlanarMeasurementGroups(unittest.TestCase):
         grps = self._content.get_volumetric_roi_measurement_groups()
         assert len(grps) == 0
 
+    def test_iter_groups(self):
+        grps = self._content.iter_planar_roi_measurement_groups(
+            reference_type=codes.DCM.ImageRegion
+        )
+        first_grp = next(grps)
+        assert first_grp.tracking_uid == self._polyline_uid
+        assert len(list(grps)) == 3
+
+    def test_iter_groups_invalid_reference_types(self):
+        # Arguments are validated before iteration starts
+        with pytest.raises(ValueError):
+            self._content.iter_planar_roi_measurement_groups(
+                reference_type=codes.DCM.ReferencedSegment
+            )
+
+    def test_get_groups_without_template_id(self):
+        expected_uids = [
+            g.tracking_uid
+            for g in self._content.get_planar_roi_measurement_groups()
+        ]
+        container = self._content[0].ContentSequence[-1]
+        del container.ContentSequence[0].ContentTemplateSequence
+        # Groups without template identifier are matched structurally and
+        # are returned in document order
+        grps = self._content.get_planar_roi_measurement_groups()
+        assert [g.tracking_uid for g in grps] == expected_uids
+
+    def test_get_groups_after_retagging(self):
+        grps = self._content.get_planar_roi_measurement_groups()
+        container = self._content[0].ContentSequence[-1]
+        template_item = container.ContentSequence[0].ContentTemplateSequence[0]
+        template_item.TemplateIdentifier = '1411'
+        assert len(self._content.get_planar_roi_measurement_groups()) == (
+            len(grps) - 1
+        )
+
+    def test_get_groups_after_append(self):
+        grps = self._content.get_planar_roi_measurement_groups()
+        container = self._content[0].ContentSequence[-1]
+        container.ContentSequence.append(
+            deepcopy(container.ContentSequence[0])
+        )
+        assert len(self._content.get_planar_roi_measurement_groups()) == (
+            len(grps) + 1
+        )
+
     def test_get_groups_by_tracking_id(self):
         grps = self._content.get_planar_roi_measurement_groups(
             tracking_uid=self._polyline_uid
@@ -5155,6 +5265,20 @@ class TestImageLibraryEntryDescriptors(unittest.TestCase):
             str(data_dir.joinpath('test_files', 'dx_image.dcm'))
         )
 
+    def test_units_not_shared(self):
+        group_1 = ImageLibraryEntryDescriptors(image=self._ref_ct_dataset)
+        group_2 = ImageLibraryEntryDescriptors(image=self._ref_ct_dataset)
+        # Rows and Columns have the same unit
+        units = [
+            item.MeasuredValueSequence[0].MeasurementUnitsCodeSequence[0]
+            for item in (group_1[2], group_1[3], group_2[2])
+        ]
+        assert units[0] is not units[1]
+        assert units[0] is not units[2]
+        units[0].CodeMeaning = 'Changed'
+        assert units[1].CodeMeaning == 'Pixels'
+        assert units[2].CodeMeaning == 'Pixels'
+
     def test_ct_construction(self):
         group = ImageLibraryEntryDescriptors(
             image=self._ref_ct_dataset,
@@ -5348,9 +5472,13 @@ class TestImageLibrary(unittest.TestCase):
         library_items = ImageLibrary([self._ref_sm_dataset])
         assert len(library_items) == 1
         library_group_item = library_items[0].ContentSequence[0]
-        assert len(library_group_item.ContentSequence) == 1
+        assert len(library_group_item.ContentSequence) == 2
         assert library_group_item.name == codes.DCM.ImageLibraryGroup
-        content_item = library_group_item.ContentSequence[0]
+        frame_of_reference_item = library_group_item.ContentSequence[0]
+        assert frame_of_reference_item.name == codes.DCM.FrameOfReferenceUID
+        assert frame_of_reference_item.value == \
+            self._ref_sm_dataset.FrameOfReferenceUID
+        content_item = library_group_item.ContentSequence[1]
         assert isinstance(content_item, ImageContentItem)
         ref_sop_instance_uid = \
             content_item.ReferencedSOPSequence[0].ReferencedSOPInstanceUID
@@ -5360,3 +5488,52 @@ class TestImageLibrary(unittest.TestCase):
                self._ref_sm_dataset.SOPInstanceUID
         assert ref_sop_class_uid == \
                self._ref_sm_dataset.SOPClassUID
+
+    def test_construction_multiple_groups(self):
+        file_path = Path(__file__)
+        data_dir = file_path.parent.parent.joinpath('data')
+        sm_dataset = dcmread(
+            str(data_dir.joinpath('test_files', 'sm_image.dcm'))
+        )
+        ct_dataset = dcmread(
+            str(data_dir.joinpath('test_files', 'ct_image.dcm'))
+        )
+
+        library_items = ImageLibrary([sm_dataset, ct_dataset])
+        assert len(library_items) == 1
+        library_group_items = library_items[0].ContentSequence
+        assert len(library_group_items) == 2
+        for group_item, dataset in zip(
+            library_group_items,
+            [sm_dataset, ct_dataset]
+        ):
+            assert group_item.ContentSequence[0].value == \
+                dataset.FrameOfReferenceUID
+            image_item = group_item.ContentSequence[1]
+            assert image_item.referenced_sop_instance_uid == \
+                dataset.SOPInstanceUID
+
+        # Concept names must not be shared between image items
+        sm_name, ct_name = [
+            group_item.ContentSequence[1].ConceptNameCodeSequence[0]
+            for group_item in library_group_items
+        ]
+        assert sm_name is not ct_name
+        sm_name.CodeMeaning = 'Changed'
+        assert ct_name.CodeMeaning == 'Source'
+
+    def test_construction_required_tags_only(self):
+        file_path = Path(__file__)
+        data_dir = file_path.parent.parent.joinpath('data')
+        ct_file_path = str(data_dir.joinpath('test_files', 'ct_image.dcm'))
+        full_dataset = dcmread(ct_file_path)
+        partial_dataset = dcmread(
+            ct_file_path,
+            specific_tags=IMAGE_LIBRARY_REQUIRED_TAGS,
+            stop_before_pixels=True
+        )
+        assert 'PatientName' not in partial_dataset
+
+        library_items = ImageLibrary([partial_dataset])
+        expected_library_items = ImageLibrary([full_dataset])
+        assert library_items == expected_library_items
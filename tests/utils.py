@@ -1,11 +1,20 @@
 from io import BytesIO
 
+from typing import Optional, Sequence, Union
+
 from pydicom.dataset import Dataset, FileMetaDataset
 from pydicom.filereader import dcmread
 
 
-def write_and_read_dataset(dataset: Dataset):
-    """Write DICOM dataset to buffer and read it back from buffer."""
+def write_and_read_dataset(
+    dataset: Dataset,
+    specific_tags: Optional[Sequence[Union[int, str]]] = None
+):
+    """Write DICOM dataset to buffer and read it back from buffer.
+
+    If `specific_tags` is given, only the listed attributes are read back.
+
+    """
     clone = Dataset(dataset)
     clone.is_little_endian = True
     if hasattr(dataset, 'file_meta'):
@@ -18,4 +27,5 @@ def write_and_read_dataset(dataset: Dataset):
         clone.is_implicit_VR = False
     with BytesIO() as fp:
         clone.save_as(fp)
-        return dcmread(fp, force=True)
+        fp.seek(0)
+        return dcmread(fp, force=True, specific_tags=specific_tags)